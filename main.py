@@ -3,28 +3,175 @@ Main script for data profiling pipeline.
 Orchestrates profiling, metadata extraction, glossary mapping, and dictionary generation.
 """
 
+import argparse
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 import yaml
-import pandas as pd
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from profiler.data_profiler import DataProfiler
-from metadata.extractor import MetadataExtractor
-from glossary.term_mapper import TermMapper
-from dictionary.generator import DictionaryGenerator
+# Pipeline modules (and pandas) are imported where they are first used so
+# configuration errors surface without paying their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
+    from profiler.data_profiler import DataProfiler
+    from metadata.extractor import MetadataExtractor
+    from glossary.term_mapper import TermMapper
+
+
+logger = logging.getLogger(__name__)
+
+YDATA_SAMPLE_SIZE = 50_000
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the data profiling pipeline.")
+    parser.add_argument(
+        '--full-profile', action='store_true',
+        help="Build the ydata-profiling HTML report from every row instead of a sample"
+    )
+    parser.add_argument(
+        '--sample-size', type=int, default=YDATA_SAMPLE_SIZE,
+        help=f"Rows sampled for the ydata-profiling HTML report (default: {YDATA_SAMPLE_SIZE:,})"
+    )
+    return parser.parse_args(argv)
 
 
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file."""
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_dataset(data_path: Path) -> 'pd.DataFrame':
+    """
+    Load a CSV dataset, using the multithreaded pyarrow parser when available.
+    
+    Columns get the same dtypes as with pandas' default parser: NumPy-backed
+    types, empty strings read as nulls, and date/time columns kept as strings
+    (pyarrow would otherwise parse them into date objects).
+    """
+    import pandas as pd
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(data_path)
+    
+    try:
+        # Sniff column types from the first block to find temporal columns;
+        # the reader is closed before any fallback re-reads the file
+        with pacsv.open_csv(data_path) as reader:
+            column_types = {
+                field.name: pa.string()
+                for field in reader.schema if pa.types.is_temporal(field.type)
+            }
+        
+        table = pacsv.read_csv(
+            data_path,
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True
+            ),
+        )
+    except pa.ArrowInvalid:
+        # Types inferred from the first block did not hold for the whole file
+        return pd.read_csv(data_path)
+    
+    return table.to_pandas(self_destruct=True)
+
+
+def run_profile(df: 'pd.DataFrame', dataset_name: str, config: dict,
+                profiles_path: Path, ydata_sample_size: Optional[int] = None) -> 'DataProfiler':
+    """
+    Step 1: profile the dataset and save the profile outputs.
+    
+    The JSON profile's basic info and quality metrics always cover every row;
+    its column profiles follow ``profiling.sample_size``. When
+    ydata_sample_size is set and the dataset is larger, the ydata-profiling
+    HTML report is built from a random sample of that many rows.
+    """
+    from profiler.data_profiler import DataProfiler
+    
+    profiler = DataProfiler(config)
+    profiler.profile_dataset(df, dataset_name)
+    
+    # Save profile
+    profiler.save_profile(dataset_name, profiles_path)
+    
+    # Generate comprehensive HTML profile report
+    if config.get('profiling', {}).get('ydata_report', True):
+        report_df = df
+        if ydata_sample_size is not None and len(df) > ydata_sample_size:
+            logger.info(
+                "Sampling %s of %s rows for the ydata report",
+                f"{ydata_sample_size:,}", f"{len(df):,}"
+            )
+            report_df = df.sample(ydata_sample_size, random_state=0)
+        profiler.generate_ydata_profile(report_df, profiles_path, dataset_name)
+    
+    return profiler
+
+
+def run_metadata(df: 'pd.DataFrame', dataset_name: str, config: dict,
+                 business_terms_path: Path, metadata_path: Path) -> 'MetadataExtractor':
+    """Step 2: extract technical metadata, enrich it and save it."""
+    from metadata.extractor import MetadataExtractor
+    from glossary.term_mapper import load_business_terms
+    
+    metadata_extractor = MetadataExtractor(config)
+    
+    # Extract metadata with source information
+    source_info = {
+        'system': 'CSV File',
+        'table': dataset_name,
+        'load_type': 'full'
+    }
+    
+    metadata_extractor.extract_metadata(df, dataset_name, source_info)
+    
+    # Load business terms and enrich metadata
+    business_terms = load_business_terms(business_terms_path)
+    
+    metadata_extractor.enrich_with_business_context(dataset_name, business_terms)
+    
+    # Save metadata
+    metadata_extractor.save_metadata(dataset_name, metadata_path)
+    
+    return metadata_extractor
+
+
+def run_glossary(columns: list, dataset_name: str, config: dict,
+                 business_terms_path: Path) -> 'TermMapper':
+    """Step 3: map columns to business terms."""
+    from glossary.term_mapper import TermMapper
+    
+    term_mapper = TermMapper(business_terms_path, config)
+    
+    # Map columns to business terms
+    term_mapper.map_columns(columns, dataset_name)
+    
+    return term_mapper
 
 
 def main():
     """Main execution function."""
+    args = parse_args()
+    
+    # Progress messages from the pipeline modules, including those running
+    # in worker threads, go through this one handler a line at a time
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     print("=" * 80)
     print("DATA PROFILING SYSTEM")
     print("=" * 80)
@@ -41,8 +188,9 @@ def main():
     profiles_path = outputs_path / 'profiles'
     metadata_path = outputs_path / 'metadata'
     dictionaries_path = outputs_path / 'dictionaries'
+    views_path = outputs_path / 'views'
     
-    for path in [outputs_path, profiles_path, metadata_path, dictionaries_path]:
+    for path in [outputs_path, profiles_path, metadata_path, dictionaries_path, views_path]:
         path.mkdir(parents=True, exist_ok=True)
     
     # Load configuration
@@ -51,62 +199,50 @@ def main():
     
     # Load data
     print(f"Loading dataset from: {data_path}")
-    df = pd.read_csv(data_path)
+    df = load_dataset(data_path)
     dataset_name = data_path.stem
     print(f"Dataset loaded: {len(df)} rows, {len(df.columns)} columns")
     print()
     
+    # Steps 1-3 only read df, so they run concurrently. Their progress lines
+    # are logged as they happen; the step reports are printed afterwards, in
+    # order, once all three have finished.
+    print("Running profiling, metadata extraction and glossary mapping...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        profile_future = executor.submit(
+            run_profile, df, dataset_name, config, profiles_path,
+            None if args.full_profile else args.sample_size
+        )
+        metadata_future = executor.submit(
+            run_metadata, df, dataset_name, config, business_terms_path, metadata_path
+        )
+        glossary_future = executor.submit(
+            run_glossary, list(df.columns), dataset_name, config, business_terms_path
+        )
+        profiler = profile_future.result()
+        metadata_extractor = metadata_future.result()
+        term_mapper = glossary_future.result()
+    print()
+    
+    profile = profiler.profile_results[dataset_name]
+    metadata = metadata_extractor.metadata_store[dataset_name]
+    
     # Step 1: Data Profiling
     print("STEP 1: DATA PROFILING")
     print("-" * 80)
-    profiler = DataProfiler(config)
-    profile = profiler.profile_dataset(df, dataset_name)
-    
-    # Print summary
     print(profiler.get_summary(dataset_name))
-    
-    # Save profile
-    profiler.save_profile(dataset_name, profiles_path)
-    
-    # Generate comprehensive HTML profile report
-    profiler.generate_ydata_profile(df, profiles_path, dataset_name)
     print()
     
     # Step 2: Metadata Extraction
     print("STEP 2: METADATA EXTRACTION")
     print("-" * 80)
-    metadata_extractor = MetadataExtractor(config)
-    
-    # Extract metadata with source information
-    source_info = {
-        'system': 'CSV File',
-        'table': dataset_name,
-        'load_type': 'full'
-    }
-    
-    metadata = metadata_extractor.extract_metadata(df, dataset_name, source_info)
-    
-    # Load business terms and enrich metadata
-    with open(business_terms_path, 'r') as f:
-        business_terms = yaml.safe_load(f)
-    
-    metadata_extractor.enrich_with_business_context(dataset_name, business_terms)
-    
-    # Generate DDL
     ddl = metadata_extractor.generate_schema_ddl(dataset_name, dataset_name, 'postgresql')
     print(f"\nGenerated DDL:\n{ddl}\n")
-    
-    # Save metadata
-    metadata_extractor.save_metadata(dataset_name, metadata_path)
     print()
     
     # Step 3: Business Glossary Mapping
     print("STEP 3: BUSINESS GLOSSARY MAPPING")
     print("-" * 80)
-    term_mapper = TermMapper(business_terms_path, config)
-    
-    # Map columns to business terms
-    mappings = term_mapper.map_columns(list(df.columns), dataset_name)
     
     # Validate mappings
     validation = term_mapper.validate_mappings(dataset_name)
@@ -118,10 +254,6 @@ def main():
     if pii_columns:
         print(f"\nPII Columns Detected: {', '.join(pii_columns)}")
     
-    # Export glossary
-    term_mapper.export_glossary(dataset_name, dictionaries_path, format='json')
-    term_mapper.export_glossary(dataset_name, dictionaries_path, format='csv')
-    
     # Print glossary report
     print(term_mapper.generate_glossary_report(dataset_name))
     print()
@@ -129,6 +261,8 @@ def main():
     # Step 4: Data Dictionary Generation
     print("STEP 4: DATA DICTIONARY GENERATION")
     print("-" * 80)
+    from dictionary.generator import DictionaryGenerator
+    
     dict_generator = DictionaryGenerator(config)
     
     # Get glossary for dictionary
@@ -139,12 +273,30 @@ def main():
         dataset_name, profile, metadata, glossary
     )
     
-    # Export in multiple formats
-    dict_generator.export_html(dataset_name, dictionaries_path)
-    dict_generator.export_json(dataset_name, dictionaries_path)
-    dict_generator.export_markdown(dataset_name, dictionaries_path)
+    # Export dictionary and glossary in multiple formats. The exporters only
+    # read the finished dictionary/mappings, so the writes run in parallel.
+    export_tasks = [
+        (dict_generator.export_html, (dataset_name, dictionaries_path), {}),
+        (dict_generator.export_json, (dataset_name, dictionaries_path), {}),
+        (dict_generator.export_markdown, (dataset_name, dictionaries_path), {}),
+        (term_mapper.export_glossary, (dataset_name, dictionaries_path), {'format': 'json'}),
+        (term_mapper.export_glossary, (dataset_name, dictionaries_path), {'format': 'csv'}),
+    ]
+    with ThreadPoolExecutor(max_workers=len(export_tasks)) as executor:
+        futures = [executor.submit(fn, *args, **kwargs) for fn, args, kwargs in export_tasks]
+        for future in futures:
+            future.result()
     
     print(f"Data dictionary generated successfully!")
+    
+    # Precompute the dashboard's tables so it does not rebuild them per click
+    from dashboard.views import save_view_frames
+    
+    save_view_frames(
+        dataset_name,
+        {'profile': profile, 'metadata': metadata, 'dictionary': dictionary},
+        views_path
+    )
     print()
     
     # Summary
@@ -155,6 +307,7 @@ def main():
     print(f"  - Data Profile: {profiles_path}")
     print(f"  - Metadata: {metadata_path}")
     print(f"  - Data Dictionaries: {dictionaries_path}")
+    print(f"  - Dashboard Views: {views_path}")
     print()
     print("Next Steps:")
     print("  1. Review the HTML data dictionary for comprehensive documentation")
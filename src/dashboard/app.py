@@ -5,68 +5,197 @@ Streamlit application for exploring profiling results.
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
+from itertools import islice
 from pathlib import Path
 import sys
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.profiler.data_profiler import DataProfiler
-from src.metadata.extractor import MetadataExtractor
-from src.glossary.term_mapper import TermMapper
-from src.dictionary.generator import DictionaryGenerator
-import yaml
+from src.dashboard.views import VIEW_FRAMES, get_view_frame_path
+
+# Plotly is imported inside the chart builders so the first page render does
+# not wait on it.
+
+# Bar charts of more than CHART_TRUNCATE_THRESHOLD categories are cut down
+# to the first MAX_CHART_CATEGORIES
+CHART_TRUNCATE_THRESHOLD = 1000
+MAX_CHART_CATEGORIES = 100
 
 
+@st.cache_data(show_spinner=False)
 def load_config():
     """Load configuration files."""
     base_path = Path(__file__).parent.parent.parent
     config_path = base_path / 'config' / 'profiling_config.yaml'
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def get_outputs_signature():
+    """
+    Build a cache key from the names and modification times of output files.
+    
+    The key changes whenever main.py writes new results, which invalidates
+    the cached load_results() data.
+    """
+    outputs_path = Path(__file__).parent.parent.parent / 'outputs'
+    if not outputs_path.exists():
+        return ()
+    return tuple(sorted(
+        (str(p.relative_to(outputs_path)), p.stat().st_mtime)
+        for pattern in ('*.json', '*.parquet')
+        for p in outputs_path.rglob(pattern)
+    ))
+
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by the stdlib encoder can hold NaN/Infinity
+            # tokens that orjson rejects (profiles no longer do)
+            pass
+    return json.loads(data)
+
 
+def _read_output(path):
+    """Read an output JSON file, returning an empty dict if it does not exist."""
+    return _read_json(path) if path.exists() else {}
 
-def load_results():
-    """Load profiling results from outputs directory."""
+
+def list_datasets():
+    """List the datasets that have a saved profile, without parsing any files."""
+    profiles_path = Path(__file__).parent.parent.parent / 'outputs' / 'profiles'
+    if not profiles_path.exists():
+        return []
+    return sorted(file.name[:-len('_profile.json')] for file in profiles_path.glob('*_profile.json'))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_results(dataset_name, outputs_signature=()):
+    """
+    Load the profiling results of one dataset from the outputs directory.
+    
+    Only the selected dataset's files are parsed, so memory use does not grow
+    with the number of profiled datasets.
+    
+    Args:
+        dataset_name: Name of the dataset to load
+        outputs_signature: Cache key from get_outputs_signature(); only used
+            so Streamlit reloads the files after they change on disk
+    """
     base_path = Path(__file__).parent.parent.parent
     outputs_path = base_path / 'outputs'
     
     results = {
-        'profiles': {},
-        'metadata': {},
-        'dictionaries': {}
+        'profile': _read_output(outputs_path / 'profiles' / f'{dataset_name}_profile.json'),
+        'metadata': _read_output(outputs_path / 'metadata' / f'{dataset_name}_metadata.json'),
+        'dictionary': _read_output(
+            outputs_path / 'dictionaries' / f'{dataset_name}_data_dictionary.json'
+        ),
     }
     
-    # Load profiles
-    profiles_path = outputs_path / 'profiles'
-    if profiles_path.exists():
-        for file in profiles_path.glob('*_profile.json'):
-            with open(file, 'r') as f:
-                dataset_name = file.stem.replace('_profile', '')
-                results['profiles'][dataset_name] = json.load(f)
-    
-    # Load metadata
-    metadata_path = outputs_path / 'metadata'
-    if metadata_path.exists():
-        for file in metadata_path.glob('*_metadata.json'):
-            with open(file, 'r') as f:
-                dataset_name = file.stem.replace('_metadata', '')
-                results['metadata'][dataset_name] = json.load(f)
-    
-    # Load dictionaries
-    dicts_path = outputs_path / 'dictionaries'
-    if dicts_path.exists():
-        for file in dicts_path.glob('*_data_dictionary.json'):
-            with open(file, 'r') as f:
-                dataset_name = file.stem.replace('_data_dictionary', '')
-                results['dictionaries'][dataset_name] = json.load(f)
-    
     return results
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_view_frame(dataset_name, view_name, outputs_signature=()):
+    """
+    Load a dashboard table precomputed by main.py.
+    
+    Falls back to building it from the JSON outputs when the parquet file is
+    missing (e.g. results from an older run) or pyarrow is not installed.
+    """
+    views_path = Path(__file__).parent.parent.parent / 'outputs' / 'views'
+    frame_path = get_view_frame_path(views_path, dataset_name, view_name)
+    
+    if frame_path.exists():
+        try:
+            return pd.read_parquet(frame_path)
+        except ImportError:
+            pass
+    
+    builder, source = VIEW_FRAMES[view_name]
+    return builder(load_results(dataset_name, outputs_signature)[source])
+
+
+def format_percentage(value):
+    """Format a dictionary percentage; older dictionaries store preformatted strings."""
+    if value is None:
+        return 'N/A'
+    if isinstance(value, str):
+        return value
+    return f"{value:.2f}%"
+
+
+@st.cache_data(show_spinner=False)
+def make_dtype_pie(dtype_df):
+    """Build the column data type pie chart."""
+    import plotly.express as px
+    
+    return px.pie(dtype_df, values='Count', names='Data Type', 
+                  title="Column Data Types")
+
+
+@st.cache_data(show_spinner=False)
+def make_quality_bar(quality_metrics):
+    """Build the quality scores bar chart."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[
+        go.Bar(x=list(quality_metrics.keys()), 
+               y=list(quality_metrics.values()),
+               marker_color=['#667eea', '#51cf66'])
+    ])
+    fig.update_layout(title="Quality Scores (%)", yaxis_range=[0, 100])
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def make_null_bar(df_nulls):
+    """
+    Build the null percentage bar chart.
+    
+    The frame is sorted by null percentage, so on very wide datasets only the
+    columns with the most nulls are drawn and the title says so.
+    """
+    import plotly.express as px
+    
+    title = 'Null Percentage by Column'
+    if len(df_nulls) > CHART_TRUNCATE_THRESHOLD:
+        title += f' (top {MAX_CHART_CATEGORIES} of {len(df_nulls):,} columns)'
+        df_nulls = df_nulls.head(MAX_CHART_CATEGORIES)
+    
+    return px.bar(df_nulls, x='Column', y='Null Percentage',
+                  title=title,
+                  color='Null Percentage',
+                  color_continuous_scale='Reds')
+
+
+@st.cache_data(show_spinner=False)
+def make_top_values_bar(df_top):
+    """Build the top values bar chart."""
+    import plotly.express as px
+    
+    return px.bar(df_top, x='Value', y='Count', title='Top 10 Values')
+
+
 def main():
     """Main dashboard function."""
     st.set_page_config(
@@ -80,17 +209,15 @@ def main():
     st.title("Data Profiling Dashboard")
     st.markdown("---")
     
-    # Load results
-    results = load_results()
+    dataset_names = list_datasets()
     
-    if not results['profiles']:
+    if not dataset_names:
         st.warning("⚠️ No profiling results found. Please run main.py first to generate profiles.")
         st.code("python main.py", language="bash")
         return
     
     # Sidebar - Dataset Selection
     st.sidebar.title("Navigation")
-    dataset_names = list(results['profiles'].keys())
     selected_dataset = st.sidebar.selectbox("Select Dataset", dataset_names)
     
     # Sidebar - View Selection
@@ -99,25 +226,30 @@ def main():
         ["Overview", "Data Quality", "Column Details", "Business Glossary", "Metadata"]
     )
     
-    # Get selected dataset data
-    profile = results['profiles'].get(selected_dataset, {})
-    metadata = results['metadata'].get(selected_dataset, {})
-    dictionary = results['dictionaries'].get(selected_dataset, {})
+    # Load selected dataset data
+    outputs_signature = get_outputs_signature()
+    results = load_results(selected_dataset, outputs_signature)
+    profile = results['profile']
+    metadata = results['metadata']
+    dictionary = results['dictionary']
+    
+    def view_frame(view_name):
+        return load_view_frame(selected_dataset, view_name, outputs_signature)
     
     # Display selected view
     if view == "Overview":
-        show_overview(profile, metadata, dictionary)
+        show_overview(profile, metadata, dictionary, view_frame)
     elif view == "Data Quality":
-        show_data_quality(profile)
+        show_data_quality(profile, view_frame)
     elif view == "Column Details":
         show_column_details(profile, dictionary)
     elif view == "Business Glossary":
-        show_business_glossary(dictionary)
+        show_business_glossary(view_frame)
     elif view == "Metadata":
-        show_metadata(metadata)
+        show_metadata(metadata, view_frame)
 
 
-def show_overview(profile, metadata, dictionary):
+def show_overview(profile, metadata, dictionary, view_frame):
     """Display overview dashboard."""
     st.header("Dataset Overview")
     
@@ -146,58 +278,35 @@ def show_overview(profile, metadata, dictionary):
     
     with col1:
         st.subheader("📊 Data Type Distribution")
-        dtypes = basic_info.get('dtypes', {})
-        if dtypes:
-            dtype_df = pd.DataFrame([
-                {'Data Type': dtype, 'Count': list(dtypes.values()).count(dtype)}
-                for dtype in set(dtypes.values())
-            ])
-            
-            fig = px.pie(dtype_df, values='Count', names='Data Type', 
-                        title="Column Data Types")
-            st.plotly_chart(fig, use_container_width=True)
+        dtype_df = view_frame('dtypes')
+        if not dtype_df.empty:
+            st.plotly_chart(make_dtype_pie(dtype_df), use_container_width=True)
     
     with col2:
         st.subheader("🎯 Data Quality Metrics")
         
         quality_metrics = {
             'Completeness': quality.get('overall_completeness', 0),
-            'Uniqueness': 100 - (basic_info.get('duplicate_rows', 0) / basic_info.get('row_count', 1) * 100),
         }
+        # Chunked profiles leave duplicate rows uncounted unless asked to
+        if basic_info.get('duplicate_rows') is not None and basic_info.get('row_count'):
+            quality_metrics['Uniqueness'] = 100 - (basic_info['duplicate_rows'] / basic_info['row_count'] * 100)
         
-        fig = go.Figure(data=[
-            go.Bar(x=list(quality_metrics.keys()), 
-                   y=list(quality_metrics.values()),
-                   marker_color=['#667eea', '#51cf66'])
-        ])
-        fig.update_layout(title="Quality Scores (%)", yaxis_range=[0, 100])
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(make_quality_bar(quality_metrics), use_container_width=True)
     
     # Column Statistics
     st.subheader("📋 Column Statistics")
-    column_profiles = profile.get('column_profiles', {})
+    df_stats = view_frame('column_stats')
     
-    if column_profiles:
-        col_stats = []
-        for col_name, col_prof in column_profiles.items():
-            col_stats.append({
-                'Column': col_name,
-                'Data Type': col_prof.get('data_type', ''),
-                'Null %': f"{col_prof.get('null_percentage', 0):.1f}%",
-                'Unique': col_prof.get('unique_count', 0),
-                'Unique %': f"{col_prof.get('unique_percentage', 0):.1f}%",
-            })
-        
-        df_stats = pd.DataFrame(col_stats)
+    if not df_stats.empty:
         st.dataframe(df_stats, use_container_width=True, hide_index=True)
 
 
-def show_data_quality(profile):
+def show_data_quality(profile, view_frame):
     """Display data quality analysis."""
     st.header("🔍 Data Quality Analysis")
     
     quality = profile.get('data_quality', {})
-    column_profiles = profile.get('column_profiles', {})
     
     # Quality Issues
     st.subheader("⚠️ Quality Issues")
@@ -220,24 +329,10 @@ def show_data_quality(profile):
     # Null Analysis
     st.subheader("📊 Null Value Analysis")
     
-    null_data = []
-    for col_name, col_prof in column_profiles.items():
-        null_pct = col_prof.get('null_percentage', 0)
-        if null_pct > 0:
-            null_data.append({
-                'Column': col_name,
-                'Null Count': col_prof.get('null_count', 0),
-                'Null Percentage': null_pct
-            })
+    df_nulls = view_frame('nulls')
     
-    if null_data:
-        df_nulls = pd.DataFrame(null_data).sort_values('Null Percentage', ascending=False)
-        
-        fig = px.bar(df_nulls, x='Column', y='Null Percentage',
-                     title='Null Percentage by Column',
-                     color='Null Percentage',
-                     color_continuous_scale='Reds')
-        st.plotly_chart(fig, use_container_width=True)
+    if not df_nulls.empty:
+        st.plotly_chart(make_null_bar(df_nulls), use_container_width=True)
         
         st.dataframe(df_nulls, use_container_width=True, hide_index=True)
     else:
@@ -252,10 +347,15 @@ def show_data_quality(profile):
     with col1:
         dup_count = quality.get('duplicate_rows_count', 0)
         dup_pct = quality.get('duplicate_rows_percentage', 0)
-        st.metric("Duplicate Rows", f"{dup_count:,}", f"{dup_pct:.2f}%")
+        if dup_count is None:
+            st.metric("Duplicate Rows", "not counted")
+        else:
+            st.metric("Duplicate Rows", f"{dup_count:,}", f"{dup_pct:.2f}%")
     
     with col2:
-        if dup_count > 0:
+        if dup_count is None:
+            st.info("Duplicate rows are not counted for chunked profiles unless profiling.streaming_duplicates is set")
+        elif dup_count > 0:
             st.warning(f"Found {dup_count:,} duplicate rows ({dup_pct:.2f}% of total)")
         else:
             st.success("No duplicate rows detected")
@@ -317,13 +417,13 @@ def show_column_details(profile, dictionary):
         stats = col_data.get('statistics', {})
         
         with col1:
-            st.metric("Null Rate", stats.get('null_percentage', 'N/A'))
+            st.metric("Null Rate", format_percentage(stats.get('null_percentage')))
         
         with col2:
             st.metric("Unique Values", f"{stats.get('unique_count', 0):,}")
         
         with col3:
-            st.metric("Unique Rate", stats.get('unique_percentage', 'N/A'))
+            st.metric("Unique Rate", format_percentage(stats.get('unique_percentage')))
         
         with col4:
             if col_data.get('owner'):
@@ -358,29 +458,30 @@ def show_column_details(profile, dictionary):
             st.subheader("📈 Top Values")
             
             top_vals = col_profile['top_values']
-            df_top = pd.DataFrame([
-                {'Value': k, 'Count': v}
-                for k, v in list(top_vals.items())[:10]
-            ])
+            df_top = pd.DataFrame({
+                'Value': list(islice(top_vals.keys(), 10)),
+                'Count': list(islice(top_vals.values(), 10)),
+            })
             
-            fig = px.bar(df_top, x='Value', y='Count', title='Top 10 Values')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(make_top_values_bar(df_top), use_container_width=True)
 
 
-def show_business_glossary(dictionary):
+def show_business_glossary(view_frame):
     """Display business glossary."""
     st.header("📚 Business Glossary")
     
-    columns = dictionary.get('columns', [])
+    df_glossary = view_frame('glossary')
     
-    if not columns:
+    if df_glossary.empty:
         st.warning("No glossary information available")
         return
     
     # Summary metrics
-    total = len(columns)
-    mapped = sum(1 for col in columns if col.get('description') and 
-                 col['description'] != 'No description available')
+    total = len(df_glossary)
+    definitions = df_glossary['Definition']
+    mapped = int((
+        definitions.notna() & ~definitions.isin(['', 'N/A', 'No description available'])
+    ).sum())
     
     col1, col2, col3 = st.columns(3)
     
@@ -398,21 +499,10 @@ def show_business_glossary(dictionary):
     # Glossary table
     st.subheader("📖 Term Definitions")
     
-    glossary_data = []
-    for col in columns:
-        glossary_data.append({
-            'Technical Name': col['technical_name'],
-            'Business Name': col['business_name'],
-            'Definition': col.get('description', 'N/A'),
-            'Owner': col.get('owner', 'Unassigned'),
-            'PII': '🔒' if col.get('is_pii') else ''
-        })
-    
-    df_glossary = pd.DataFrame(glossary_data)
     st.dataframe(df_glossary, use_container_width=True, hide_index=True)
     
     # PII columns
-    pii_columns = [col['technical_name'] for col in columns if col.get('is_pii')]
+    pii_columns = df_glossary.loc[df_glossary['PII'] != '', 'Technical Name'].tolist()
     
     if pii_columns:
         st.markdown("---")
@@ -422,27 +512,15 @@ def show_business_glossary(dictionary):
             st.write(f"- {col}")
 
 
-def show_metadata(metadata):
+def show_metadata(metadata, view_frame):
     """Display technical metadata."""
     st.header("⚙️ Technical Metadata")
     
     # Schema Information
     st.subheader("📐 Schema")
     
-    schema = metadata.get('schema', [])
-    if schema:
-        schema_data = []
-        for col in schema:
-            schema_data.append({
-                'Column': col['column_name'],
-                'Data Type': col['data_type'],
-                'SQL Type': col['sql_type'],
-                'Nullable': '✓' if col['nullable'] else '✗',
-                'Unique': '✓' if col['is_unique'] else '✗',
-                'Position': col['position']
-            })
-        
-        df_schema = pd.DataFrame(schema_data)
+    df_schema = view_frame('schema')
+    if not df_schema.empty:
         st.dataframe(df_schema, use_container_width=True, hide_index=True)
     
     # Statistics
@@ -0,0 +1,116 @@
+"""
+Dashboard View Frames
+Builds the tables shown by the dashboard from the pipeline outputs.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Any
+
+
+def build_dtype_frame(profile: Dict[str, Any]) -> pd.DataFrame:
+    """Count columns per data type."""
+    dtypes = profile.get('basic_info', {}).get('dtypes', {})
+    
+    return (
+        pd.Series(list(dtypes.values()), dtype=object)
+        .value_counts()
+        .rename_axis('Data Type')
+        .reset_index(name='Count')
+    )
+
+
+def build_column_stats_frame(profile: Dict[str, Any]) -> pd.DataFrame:
+    """Build the per-column statistics table."""
+    col_stats = {'Column': [], 'Data Type': [], 'Null %': [], 'Unique': [], 'Unique %': []}
+    
+    for col_name, col_prof in profile.get('column_profiles', {}).items():
+        col_stats['Column'].append(col_name)
+        col_stats['Data Type'].append(col_prof.get('data_type', ''))
+        col_stats['Null %'].append(f"{col_prof.get('null_percentage', 0):.1f}%")
+        col_stats['Unique'].append(col_prof.get('unique_count', 0))
+        col_stats['Unique %'].append(f"{col_prof.get('unique_percentage', 0):.1f}%")
+    
+    return pd.DataFrame(col_stats)
+
+
+def build_null_frame(profile: Dict[str, Any]) -> pd.DataFrame:
+    """Build the table of columns with nulls, most nulls first."""
+    null_data = {'Column': [], 'Null Count': [], 'Null Percentage': []}
+    
+    for col_name, col_prof in profile.get('column_profiles', {}).items():
+        null_pct = col_prof.get('null_percentage', 0)
+        if null_pct > 0:
+            null_data['Column'].append(col_name)
+            null_data['Null Count'].append(col_prof.get('null_count', 0))
+            null_data['Null Percentage'].append(null_pct)
+    
+    return pd.DataFrame(null_data).sort_values('Null Percentage', ascending=False)
+
+
+def build_glossary_frame(dictionary: Dict[str, Any]) -> pd.DataFrame:
+    """Build the business glossary table."""
+    columns = dictionary.get('columns', [])
+    
+    return pd.DataFrame({
+        'Technical Name': [col['technical_name'] for col in columns],
+        'Business Name': [col['business_name'] for col in columns],
+        'Definition': [col.get('description', 'N/A') for col in columns],
+        'Owner': [col.get('owner', 'Unassigned') for col in columns],
+        'PII': ['🔒' if col.get('is_pii') else '' for col in columns],
+    })
+
+
+def build_schema_frame(metadata: Dict[str, Any]) -> pd.DataFrame:
+    """Build the schema table."""
+    schema = metadata.get('schema', [])
+    
+    return pd.DataFrame({
+        'Column': [col['column_name'] for col in schema],
+        'Data Type': [col['data_type'] for col in schema],
+        'SQL Type': [col['sql_type'] for col in schema],
+        'Nullable': ['✓' if col['nullable'] else '✗' for col in schema],
+        'Unique': ['✓' if col['is_unique'] else '✗' for col in schema],
+        'Position': [col['position'] for col in schema],
+    })
+
+
+# View name -> (builder, pipeline output it is built from)
+VIEW_FRAMES = {
+    'dtypes': (build_dtype_frame, 'profile'),
+    'column_stats': (build_column_stats_frame, 'profile'),
+    'nulls': (build_null_frame, 'profile'),
+    'glossary': (build_glossary_frame, 'dictionary'),
+    'schema': (build_schema_frame, 'metadata'),
+}
+
+
+def get_view_frame_path(views_path: Path, dataset_name: str, view_name: str) -> Path:
+    """Return the parquet file path of a precomputed view frame."""
+    return views_path / f"{dataset_name}_{view_name}.parquet"
+
+
+def save_view_frames(dataset_name: str, outputs: Dict[str, Dict[str, Any]],
+                     views_path: Path) -> None:
+    """
+    Precompute the dashboard tables and save them as parquet files.
+    
+    Args:
+        dataset_name: Name of the dataset
+        outputs: Pipeline outputs keyed by 'profile', 'metadata' and 'dictionary'
+        views_path: Directory to save the view frames
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow not installed. Skipping dashboard view frames.")
+        return
+    
+    for view_name, (builder, source) in VIEW_FRAMES.items():
+        frame = builder(outputs[source])
+        frame.to_parquet(
+            get_view_frame_path(views_path, dataset_name, view_name),
+            engine='pyarrow', compression='zstd', index=False
+        )
+    
+    print(f"Dashboard view frames saved to: {views_path}")
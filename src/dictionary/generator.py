@@ -8,7 +8,181 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import json
-from jinja2 import Template
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+TEMPLATES_PATH = Path(__file__).parent / 'templates'
+
+# Profile statistics copied into each column definition
+_BASE_STAT_KEYS = ('null_count', 'null_percentage', 'unique_count', 'unique_percentage')
+_NUMERIC_STAT_KEYS = ('min', 'max', 'mean', 'median')
+
+# Glossary fields read for each column; the list fields at the end are copied
+# when non-empty under the dictionary keys in _TERM_LIST_KEYS
+_TERM_KEYS = (
+    'business_name', 'definition', 'owner', 'is_pii',
+    'valid_values', 'examples', 'related_terms',
+)
+_TERM_LIST_KEYS = ('valid_values', 'business_examples', 'related_fields')
+
+# Fixed part of a column's Markdown section; optional lines follow it
+_COLUMN_MD_TEMPLATE = (
+    "\n### {business_name} (`{technical_name}`)\n"
+    "\n{description}\n\n"
+    "- **Data Type**: {sql_type}\n"
+    "- **Nullable**: {nullable}\n"
+    "- **Null Rate**: {null_percentage:.2f}%\n"
+    "- **Unique Values**: {unique_count:,}"
+)
+
+# Quality score labels by minimum score, highest first
+_QUALITY_BUCKETS = (
+    (90, 'Excellent'),
+    (75, 'Good'),
+    (60, 'Fair'),
+    (0, 'Needs Improvement'),
+)
+
+
+def _format_stats(base_values: tuple, numeric_values: Optional[tuple]) -> Dict[str, Any]:
+    """
+    Build a column's statistics section from its profile values.
+    
+    Args:
+        base_values: Values for _BASE_STAT_KEYS
+        numeric_values: Values for _NUMERIC_STAT_KEYS, or None for
+            non-numeric columns
+        
+    Returns:
+        Statistics dictionary
+    """
+    stats = dict(zip(_BASE_STAT_KEYS, base_values))
+    if numeric_values is not None:
+        stats.update(zip(_NUMERIC_STAT_KEYS, numeric_values))
+    return stats
+
+
+def _build_column(col_schema: Dict[str, Any], col_profile: Dict[str, Any],
+                  col_term: Dict[str, Any], include_samples: bool) -> Dict[str, Any]:
+    """
+    Build one column definition of the data dictionary.
+    
+    Args:
+        col_schema: Column schema from the metadata
+        col_profile: Column profile, or an empty dict
+        col_term: Glossary term mapped to the column, or an empty dict
+        include_samples: Whether to include sample values
+        
+    Returns:
+        Column definition
+    """
+    col_name = col_schema['column_name']
+    (business_name, definition, owner, is_pii,
+     *term_lists) = map(col_term.get, _TERM_KEYS)
+    
+    column_def = {
+        'technical_name': col_name,
+        'business_name': business_name if 'business_name' in col_term else col_name,
+        'position': col_schema.get('position', 0),
+        'description': definition if 'definition' in col_term else '',
+        'data_type': {
+            'pandas': col_schema.get('data_type', ''),
+            'sql': col_schema.get('sql_type', ''),
+            'python': col_schema.get('python_type', ''),
+        },
+        'nullable': col_schema.get('nullable', True),
+        'is_unique': col_schema.get('is_unique', False),
+        # Numeric statistics are included when available
+        'statistics': _format_stats(
+            tuple(col_profile.get(key, 0) for key in _BASE_STAT_KEYS),
+            tuple(col_profile.get(key) for key in _NUMERIC_STAT_KEYS)
+            if 'min' in col_profile else None
+        ),
+    }
+    
+    # Add categorical information if available
+    if 'top_values' in col_profile:
+        column_def['top_values'] = col_profile['top_values']
+    
+    # Add sample values
+    if include_samples:
+        column_def['sample_values'] = list(col_profile.get('sample_values', []))
+    
+    # Add business context
+    if owner:
+        column_def['owner'] = owner
+    
+    if is_pii:
+        column_def['is_pii'] = True
+        column_def['sensitivity'] = 'HIGH'
+    
+    for column_key, value in zip(_TERM_LIST_KEYS, term_lists):
+        if value:
+            column_def[column_key] = value
+    
+    return column_def
+
+
+@lru_cache(maxsize=4096)
+def _join_samples(sample_values: tuple) -> str:
+    """
+    Join a column's sample values for display.
+    
+    Callers pass the sample values as a tuple so the joined string is
+    cached, and the HTML and Markdown exports of the same dictionary share it.
+    """
+    return ', '.join(map(str, sample_values))
+
+
+def _template_column(column: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a column definition into the fields the HTML template reads."""
+    statistics = column['statistics']
+    return {
+        'business_name': column['business_name'],
+        'technical_name': column['technical_name'],
+        'sql_type': column['data_type']['sql'],
+        'description': column['description'],
+        'is_unique': column['is_unique'],
+        'nullable': column['nullable'],
+        'is_pii': column.get('is_pii'),
+        'null_percentage': statistics['null_percentage'],
+        'unique_count': statistics['unique_count'],
+        'owner': column.get('owner'),
+        'sample_text': _join_samples(tuple(column['sample_values'])) if column.get('sample_values') else None,
+    }
+
+
+@cache
+def _get_html_template():
+    """
+    Load the HTML dictionary template.
+    
+    jinja2 is imported on first use, so JSON and Markdown exports don't pay
+    for it. Compiled template bytecode is cached on disk, so later runs skip
+    parsing and compiling the template; within a run it is loaded once.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_PATH),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+    env.filters.update({
+        'pct': lambda value: f"{value:.2f}%",
+        'mb': lambda value: f"{value:.2f} MB",
+        'thousands': lambda value: f"{value:,}",
+    })
+    return env.get_template('data_dictionary.html')
 
 
 class DictionaryGenerator:
@@ -40,12 +214,14 @@ class DictionaryGenerator:
         Returns:
             Complete data dictionary
         """
-        print(f"Generating data dictionary for: {dataset_name}")
+        logger.info("Generating data dictionary for: %s", dataset_name)
+        
+        generated_at = datetime.now()
         
         dictionary = {
             'dataset_name': dataset_name,
-            'generation_date': datetime.now().isoformat(),
-            'overview': self._create_overview(profile, metadata),
+            'generation_date': generated_at.isoformat(),
+            'overview': self._create_overview(profile, metadata, generated_at),
             'columns': self._create_column_definitions(profile, metadata, glossary),
             'data_quality': self._create_quality_section(profile),
             'usage_notes': self._create_usage_notes(dataset_name),
@@ -55,7 +231,7 @@ class DictionaryGenerator:
         return dictionary
     
     def _create_overview(self, profile: Dict[str, Any], 
-                        metadata: Dict[str, Any]) -> Dict[str, Any]:
+                        metadata: Dict[str, Any], generated_at: datetime) -> Dict[str, Any]:
         """Create overview section of dictionary."""
         basic_info = profile.get('basic_info', {})
         stats = metadata.get('statistics', {})
@@ -64,8 +240,8 @@ class DictionaryGenerator:
             'description': f"Dataset containing {basic_info.get('row_count', 0):,} records across {basic_info.get('column_count', 0)} fields",
             'record_count': basic_info.get('row_count', 0),
             'field_count': basic_info.get('column_count', 0),
-            'size_mb': f"{basic_info.get('memory_usage_mb', 0):.2f} MB",
-            'last_updated': datetime.now().strftime('%Y-%m-%d'),
+            'size_mb': basic_info.get('memory_usage_mb', 0),
+            'last_updated': generated_at.strftime('%Y-%m-%d'),
             'refresh_frequency': 'Daily',  # Could be configured
         }
     
@@ -76,79 +252,28 @@ class DictionaryGenerator:
         column_profiles = profile.get('column_profiles', {})
         schema = metadata.get('schema', [])
         terms = glossary.get('terms', {})
+        include_samples = self.config.get('dictionary', {}).get('include_samples', True)
+        get_profile = column_profiles.get
+        get_term = terms.get
         
-        columns = []
-        
-        for col_schema in schema:
-            col_name = col_schema['column_name']
-            col_profile = column_profiles.get(col_name, {})
-            col_term = terms.get(col_name, {})
-            
-            column_def = {
-                'technical_name': col_name,
-                'business_name': col_term.get('business_name', col_name),
-                'position': col_schema.get('position', 0),
-                'description': col_term.get('definition', ''),
-                'data_type': {
-                    'pandas': col_schema.get('data_type', ''),
-                    'sql': col_schema.get('sql_type', ''),
-                    'python': col_schema.get('python_type', ''),
-                },
-                'nullable': col_schema.get('nullable', True),
-                'is_unique': col_schema.get('is_unique', False),
-                'statistics': {
-                    'null_count': col_profile.get('null_count', 0),
-                    'null_percentage': f"{col_profile.get('null_percentage', 0):.2f}%",
-                    'unique_count': col_profile.get('unique_count', 0),
-                    'unique_percentage': f"{col_profile.get('unique_percentage', 0):.2f}%",
-                }
-            }
-            
-            # Add numeric statistics if available
-            if 'min' in col_profile:
-                column_def['statistics'].update({
-                    'min': col_profile.get('min'),
-                    'max': col_profile.get('max'),
-                    'mean': col_profile.get('mean'),
-                    'median': col_profile.get('median'),
-                })
-            
-            # Add categorical information if available
-            if 'top_values' in col_profile:
-                column_def['top_values'] = col_profile['top_values']
-            
-            # Add sample values
-            if self.config.get('dictionary', {}).get('include_samples', True):
-                column_def['sample_values'] = col_profile.get('sample_values', [])
-            
-            # Add business context
-            if col_term.get('owner'):
-                column_def['owner'] = col_term['owner']
-            
-            if col_term.get('is_pii'):
-                column_def['is_pii'] = True
-                column_def['sensitivity'] = 'HIGH'
-            
-            if col_term.get('valid_values'):
-                column_def['valid_values'] = col_term['valid_values']
-            
-            if col_term.get('examples'):
-                column_def['business_examples'] = col_term['examples']
-            
-            if col_term.get('related_terms'):
-                column_def['related_fields'] = col_term['related_terms']
-            
-            columns.append(column_def)
-        
-        return columns
+        return [
+            _build_column(
+                col_schema,
+                get_profile(col_schema['column_name'], {}),
+                get_term(col_schema['column_name'], {}),
+                include_samples,
+            )
+            for col_schema in schema
+        ]
     
     def _create_quality_section(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         """Create data quality section."""
         quality = profile.get('data_quality', {})
+        duplicate_records = quality.get('duplicate_rows_count', 0)
         
         quality_section = {
-            'overall_completeness': f"{quality.get('overall_completeness', 0):.2f}%",
-            'duplicate_records': quality.get('duplicate_rows_count', 0),
+            'overall_completeness': quality.get('overall_completeness', 0),
+            'duplicate_records': duplicate_records if duplicate_records is not None else 'not counted',
             'quality_issues': quality.get('quality_issues', []),
             'quality_score': self._calculate_quality_score(quality),
         }
@@ -158,21 +283,14 @@ class DictionaryGenerator:
     def _calculate_quality_score(self, quality: Dict[str, Any]) -> str:
         """Calculate overall quality score."""
         completeness = quality.get('overall_completeness', 0)
-        issues_count = len(quality.get('quality_issues', []))
+        issues_count = len(quality.get('quality_issues') or ())
         
-        # Simple scoring logic
-        score = completeness
-        score -= (issues_count * 5)  # Penalize for issues
-        score = max(0, min(100, score))  # Clamp between 0-100
+        # Simple scoring logic: penalize each issue, then round once so the
+        # label is chosen from the same whole-number score that is shown
+        score = max(0, min(100, round(completeness - issues_count * 5)))
         
-        if score >= 90:
-            return f"{score:.0f}% (Excellent)"
-        elif score >= 75:
-            return f"{score:.0f}% (Good)"
-        elif score >= 60:
-            return f"{score:.0f}% (Fair)"
-        else:
-            return f"{score:.0f}% (Needs Improvement)"
+        label = next(label for threshold, label in _QUALITY_BUCKETS if score >= threshold)
+        return f"{score}% ({label})"
     
     def _create_usage_notes(self, dataset_name: str) -> Dict[str, Any]:
         """Create usage notes and recommendations."""
@@ -196,363 +314,137 @@ class DictionaryGenerator:
             dataset_name: Name of the dataset
             output_path: Directory to save HTML file
         """
-        if dataset_name not in self.dictionaries:
+        dictionary = self.dictionaries.get(dataset_name)
+        if dictionary is None:
             raise ValueError(f"No dictionary found for dataset: {dataset_name}")
         
-        dictionary = self.dictionaries[dataset_name]
-        
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Dictionary - {{ dataset_name }}</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }
-        .header h1 {
-            margin: 0;
-            font-size: 2.5em;
-        }
-        .header p {
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-        }
-        .section {
-            background: white;
-            padding: 25px;
-            margin-bottom: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .section h2 {
-            color: #667eea;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-            margin-top: 0;
-        }
-        .overview-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }
-        .metric {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 4px solid #667eea;
-        }
-        .metric-label {
-            font-size: 0.9em;
-            color: #666;
-            margin-bottom: 5px;
-        }
-        .metric-value {
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #333;
-        }
-        .column-card {
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-            background: #fafafa;
-        }
-        .column-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }
-        .column-name {
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #333;
-        }
-        .column-type {
-            background: #667eea;
-            color: white;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.85em;
-        }
-        .column-description {
-            color: #555;
-            margin-bottom: 15px;
-            font-style: italic;
-        }
-        .column-details {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 10px;
-            margin-top: 15px;
-        }
-        .detail-item {
-            font-size: 0.9em;
-        }
-        .detail-label {
-            color: #666;
-            font-weight: 600;
-        }
-        .detail-value {
-            color: #333;
-        }
-        .badge {
-            display: inline-block;
-            padding: 3px 8px;
-            border-radius: 12px;
-            font-size: 0.8em;
-            font-weight: 600;
-            margin-right: 5px;
-        }
-        .badge-pii {
-            background: #ff6b6b;
-            color: white;
-        }
-        .badge-unique {
-            background: #51cf66;
-            color: white;
-        }
-        .badge-nullable {
-            background: #ffd43b;
-            color: #333;
-        }
-        .sample-values {
-            background: white;
-            padding: 10px;
-            border-radius: 5px;
-            border-left: 3px solid #667eea;
-            margin-top: 10px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-        }
-        .quality-score {
-            font-size: 2em;
-            font-weight: bold;
-            color: #51cf66;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }
-        th, td {
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        th {
-            background: #f8f9fa;
-            font-weight: 600;
-            color: #333;
-        }
-        .footer {
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            font-size: 0.9em;
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>📊 Data Dictionary</h1>
-        <p>{{ dataset_name }}</p>
-        <p>Generated: {{ generation_date }}</p>
-    </div>
-
-    <div class="section">
-        <h2>Overview</h2>
-        <p>{{ overview.description }}</p>
-        <div class="overview-grid">
-            <div class="metric">
-                <div class="metric-label">Total Records</div>
-                <div class="metric-value">{{ "{:,}".format(overview.record_count) }}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Total Fields</div>
-                <div class="metric-value">{{ overview.field_count }}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Dataset Size</div>
-                <div class="metric-value">{{ overview.size_mb }}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Last Updated</div>
-                <div class="metric-value">{{ overview.last_updated }}</div>
-            </div>
-        </div>
-    </div>
-
-    <div class="section">
-        <h2>Data Quality</h2>
-        <div class="overview-grid">
-            <div class="metric">
-                <div class="metric-label">Completeness</div>
-                <div class="metric-value">{{ data_quality.overall_completeness }}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Quality Score</div>
-                <div class="quality-score">{{ data_quality.quality_score }}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Duplicate Records</div>
-                <div class="metric-value">{{ data_quality.duplicate_records }}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Quality Issues</div>
-                <div class="metric-value">{{ data_quality.quality_issues|length }}</div>
-            </div>
-        </div>
-    </div>
-
-    <div class="section">
-        <h2>Column Definitions</h2>
-        {% for column in columns %}
-        <div class="column-card">
-            <div class="column-header">
-                <div>
-                    <div class="column-name">{{ column.business_name }}</div>
-                    <div style="font-size: 0.9em; color: #666;">{{ column.technical_name }}</div>
-                </div>
-                <div class="column-type">{{ column.data_type.sql }}</div>
-            </div>
-            
-            <div class="column-description">
-                {{ column.description or "No description available" }}
-            </div>
-            
-            <div>
-                {% if column.is_unique %}
-                <span class="badge badge-unique">UNIQUE</span>
-                {% endif %}
-                {% if column.nullable %}
-                <span class="badge badge-nullable">NULLABLE</span>
-                {% endif %}
-                {% if column.is_pii %}
-                <span class="badge badge-pii">⚠️ PII</span>
-                {% endif %}
-            </div>
-            
-            <div class="column-details">
-                <div class="detail-item">
-                    <div class="detail-label">Null Rate</div>
-                    <div class="detail-value">{{ column.statistics.null_percentage }}</div>
-                </div>
-                <div class="detail-item">
-                    <div class="detail-label">Unique Values</div>
-                    <div class="detail-value">{{ "{:,}".format(column.statistics.unique_count) }}</div>
-                </div>
-                {% if column.owner %}
-                <div class="detail-item">
-                    <div class="detail-label">Owner</div>
-                    <div class="detail-value">{{ column.owner }}</div>
-                </div>
-                {% endif %}
-            </div>
-            
-            {% if column.sample_values %}
-            <div class="sample-values">
-                <strong>Sample Values:</strong> {{ column.sample_values|join(', ') }}
-            </div>
-            {% endif %}
-        </div>
-        {% endfor %}
-    </div>
-
-    <div class="footer">
-        <p>Generated by Automated Data Profiling System</p>
-        <p>For questions or updates, contact the data governance team</p>
-    </div>
-</body>
-</html>
-        """
-        
-        template = Template(html_template)
-        html_content = template.render(**dictionary)
-        
         output_file = output_path / f"{dataset_name}_data_dictionary.html"
-        with open(output_file, 'w') as f:
-            f.write(html_content)
         
-        print(f"HTML dictionary saved to: {output_file}")
+        # Write rendered chunks as they are produced instead of building the
+        # whole document in memory first
+        # The template reads flat column fields, which is cheaper for Jinja
+        # than resolving nested attributes for every column
+        stream = _get_html_template().stream({
+            **dictionary,
+            'columns': [_template_column(column) for column in dictionary['columns']],
+        })
+        stream.enable_buffering(size=50)
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            stream.dump(f)
+        
+        logger.info("HTML dictionary saved to: %s", output_file)
     
-    def export_json(self, dataset_name: str, output_path: Path) -> None:
-        """Export dictionary as JSON."""
-        if dataset_name not in self.dictionaries:
+    def export_json(self, dataset_name: str, output_path: Path, pretty: bool = False) -> None:
+        """
+        Export dictionary as JSON.
+        
+        Args:
+            dataset_name: Name of the dataset
+            output_path: Directory to save JSON file
+            pretty: Indent the output for human readers; compact output is
+                smaller and faster to write for tools that consume it
+        """
+        dictionary = self.dictionaries.get(dataset_name)
+        if dictionary is None:
             raise ValueError(f"No dictionary found for dataset: {dataset_name}")
         
         output_file = output_path / f"{dataset_name}_data_dictionary.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(self.dictionaries[dataset_name], f, indent=2)
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            output_file.write_bytes(orjson.dumps(dictionary, option=option))
+        else:
+            # Match orjson's output: UTF-8 text rather than \u escapes
+            with open(output_file, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(dictionary, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(dictionary, f,
+                              separators=(',', ':'), ensure_ascii=False)
         
-        print(f"JSON dictionary saved to: {output_file}")
+        logger.info("JSON dictionary saved to: %s", output_file)
     
     def export_markdown(self, dataset_name: str, output_path: Path) -> None:
         """Export dictionary as Markdown."""
-        if dataset_name not in self.dictionaries:
+        dictionary = self.dictionaries.get(dataset_name)
+        if dictionary is None:
             raise ValueError(f"No dictionary found for dataset: {dataset_name}")
         
-        dictionary = self.dictionaries[dataset_name]
-        
-        md_lines = [
+        md_header = [
             f"# Data Dictionary: {dataset_name}",
             f"\n*Generated: {dictionary['generation_date']}*\n",
             "## Overview",
             f"\n{dictionary['overview']['description']}\n",
             f"- **Records**: {dictionary['overview']['record_count']:,}",
             f"- **Fields**: {dictionary['overview']['field_count']}",
-            f"- **Size**: {dictionary['overview']['size_mb']}",
+            f"- **Size**: {dictionary['overview']['size_mb']:.2f} MB",
             f"- **Last Updated**: {dictionary['overview']['last_updated']}",
             "\n## Data Quality",
-            f"\n- **Completeness**: {dictionary['data_quality']['overall_completeness']}",
+            f"\n- **Completeness**: {dictionary['data_quality']['overall_completeness']:.2f}%",
             f"- **Quality Score**: {dictionary['data_quality']['quality_score']}",
             f"- **Duplicate Records**: {dictionary['data_quality']['duplicate_records']}",
             "\n## Column Definitions\n"
         ]
         
-        for col in dictionary['columns']:
-            md_lines.extend([
-                f"### {col['business_name']} (`{col['technical_name']}`)",
-                f"\n{col['description']}\n",
-                f"- **Data Type**: {col['data_type']['sql']}",
-                f"- **Nullable**: {col['nullable']}",
-                f"- **Null Rate**: {col['statistics']['null_percentage']}",
-                f"- **Unique Values**: {col['statistics']['unique_count']:,}",
-            ])
-            
-            if col.get('owner'):
-                md_lines.append(f"- **Owner**: {col['owner']}")
-            
-            if col.get('is_pii'):
-                md_lines.append(f"- **⚠️ Contains PII**")
-            
-            if col.get('sample_values'):
-                samples = ', '.join(col['sample_values'])
-                md_lines.append(f"- **Sample Values**: {samples}")
+        output_file = output_path / f"{dataset_name}_data_dictionary.md"
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            f.write('\n'.join(md_header))
             
-            md_lines.append("")
+            # Each column section is written as soon as it is formatted
+            for col in dictionary['columns']:
+                f.write(_COLUMN_MD_TEMPLATE.format_map({
+                    'business_name': col['business_name'],
+                    'technical_name': col['technical_name'],
+                    'description': col['description'],
+                    'sql_type': col['data_type']['sql'],
+                    'nullable': col['nullable'],
+                    'null_percentage': col['statistics']['null_percentage'],
+                    'unique_count': col['statistics']['unique_count'],
+                }))
+                
+                if col.get('owner'):
+                    f.write(f"\n- **Owner**: {col['owner']}")
+                
+                if col.get('is_pii'):
+                    f.write("\n- **⚠️ Contains PII**")
+                
+                if col.get('sample_values'):
+                    f.write(f"\n- **Sample Values**: {_join_samples(tuple(col['sample_values']))}")
+                
+                f.write("\n")
         
-        output_file = output_path / f"{dataset_name}_data_dictionary.md"
-        with open(output_file, 'w') as f:
-            f.write('\n'.join(md_lines))
+        logger.info("Markdown dictionary saved to: %s", output_file)
+    
+    def export_all(self, output_path: Path,
+                   formats: tuple = ('html', 'json', 'markdown'),
+                   max_workers: int = 4) -> None:
+        """
+        Export every generated dictionary in the given formats.
         
-        print(f"Markdown dictionary saved to: {output_file}")
+        The exporters spend most of their time writing files, so they run
+        in a thread pool.
+        
+        Args:
+            output_path: Directory to save the exported files
+            formats: Export formats ('html', 'json' and/or 'markdown')
+            max_workers: Maximum number of export threads
+        """
+        exporters = {
+            'html': self.export_html,
+            'json': self.export_json,
+            'markdown': self.export_markdown,
+        }
+        unknown = set(formats) - exporters.keys()
+        if unknown:
+            raise ValueError(f"Unsupported export format(s): {', '.join(sorted(unknown))}")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(exporters[fmt], dataset_name, output_path)
+                for dataset_name in self.dictionaries
+                for fmt in formats
+            ]
+            for future in futures:
+                future.result()
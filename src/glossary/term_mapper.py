@@ -5,10 +5,196 @@ Maps technical column names to business terminology.
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import yaml
 from difflib import SequenceMatcher
 import json
+import logging
+import hashlib
+import os
+import tempfile
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+import numpy as np
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_atomic(path: Path, payload: str) -> None:
+    """
+    Write a file through a temporary file and a rename, so concurrent
+    readers never see it half written.
+    """
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix='.tmp', delete=False) as f:
+        f.write(payload)
+    os.replace(f.name, path)
+
+
+def load_business_terms(terms_path: str) -> Dict[str, Any]:
+    """
+    Load business terms from a YAML file.
+    
+    The parsed terms are cached as JSON next to the YAML file, keyed on the
+    file's content hash, so unchanged glossaries skip YAML parsing.
+    
+    Args:
+        terms_path: Path to business terms YAML file
+        
+    Returns:
+        Parsed business terms
+    """
+    return _load_business_terms_with_hash(terms_path)[0]
+
+
+def _load_business_terms_with_hash(terms_path: str) -> Tuple[Dict[str, Any], str]:
+    """Load business terms and return them with the YAML file's SHA-1."""
+    source = Path(terms_path).read_bytes()
+    source_hash = hashlib.sha1(source).hexdigest()
+    cache_path = Path(terms_path).with_suffix('.cache.json')
+    
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if cached.get('hash') == source_hash:
+            return cached['data'], source_hash
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    terms = yaml.load(source, Loader=SafeLoader)
+    
+    # Only cache terms that survive a JSON round trip unchanged (YAML can
+    # also produce dates, non-string keys, ...)
+    try:
+        payload = json.dumps({'hash': source_hash, 'data': terms})
+        if json.loads(payload)['data'] == terms:
+            _write_atomic(cache_path, payload)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return terms, source_hash
+
+
+# map_columns results kept in a glossary's .mappings.cache.json, oldest
+# dropped first
+MAPPING_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=4096)
+def _default_business_name(technical_name: str) -> str:
+    """Derive a readable name for an unmapped column (order_id -> Order Id)."""
+    return technical_name.replace('_', ' ').title()
+
+
+def _trigrams(text: str) -> Counter:
+    """Count the character trigrams of a string."""
+    return Counter(text[i:i + 3] for i in range(len(text) - 2))
+
+
+# Glossary dictionary keys of a mapping, in to_dict() order. Each key names
+# the ColumnMapping attribute or property holding its value.
+_UNMAPPED_KEYS = ('technical_name', 'business_name', 'definition', 'mapped', 'match_type')
+_MAPPED_KEYS = (
+    'technical_name', 'business_name', 'definition', 'data_type', 'format',
+    'examples', 'owner', 'related_terms', 'is_pii', 'valid_values',
+    'match_type', 'mapped',
+)
+_FUZZY_KEYS = _MAPPED_KEYS + ('fuzzy_match_score', 'matched_term')
+
+
+@dataclass(slots=True)
+class ColumnMapping(Mapping):
+    """
+    Mapping of a technical column name to a business term.
+    
+    Mappings are kept as slotted objects while in memory and converted to
+    dictionaries with to_dict() when the glossary is handed out or exported.
+    Descriptive term fields (data type, format, examples, related terms and
+    valid values) are read from the shared glossary entry when accessed
+    instead of being copied into every mapping.
+    
+    Mappings are also read-only Mappings with the same keys as to_dict(),
+    so code written against the dictionaries map_columns used to return
+    (``mapping['business_name']``, ``mapping.get('is_pii')``) keeps working.
+    Keys are read straight from the attributes; no dict is built.
+    """
+    technical_name: str
+    business_name: str
+    definition: str
+    match_type: str
+    mapped: bool
+    owner: str = ''
+    is_pii: bool = False
+    fuzzy_match_score: Optional[float] = None
+    matched_term: Optional[str] = None
+    term_info: Dict[str, Any] = field(default_factory=dict, repr=False)
+    
+    @property
+    def data_type(self) -> str:
+        return self.term_info.get('data_type', '')
+    
+    @property
+    def format(self) -> str:
+        return self.term_info.get('format', '')
+    
+    @property
+    def examples(self) -> list:
+        return self.term_info.get('examples', [])
+    
+    @property
+    def related_terms(self) -> list:
+        return self.term_info.get('related_terms', [])
+    
+    @property
+    def valid_values(self) -> list:
+        return self.term_info.get('valid_values', [])
+    
+    def _keys(self) -> tuple:
+        """Return the glossary dictionary keys of this mapping."""
+        if not self.mapped:
+            return _UNMAPPED_KEYS
+        return _FUZZY_KEYS if self.match_type == 'fuzzy' else _MAPPED_KEYS
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the mapping to its glossary dictionary form."""
+        return {key: getattr(self, key) for key in self._keys()}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self._keys())
+    
+    def __len__(self) -> int:
+        return len(self._keys())
 
 
 class TermMapper:
@@ -27,13 +213,103 @@ class TermMapper:
         self.config = config
         self.business_terms = self._load_business_terms(business_terms_path)
         self.mappings = {}
+        self.pii_columns = {}
+        self.column_owners = {}
+        # map_columns results by input signature (see _mapping_cache_key),
+        # persisted next to the glossary and read on first use
+        self._mapping_cache_path = Path(business_terms_path).with_suffix('.mappings.cache.json')
+        self._mapping_cache = None
+        self._match_candidates = self._build_match_candidates(
+            self.business_terms.get('terms', {})
+        )
+        self._match_names = [name for name, _, _ in self._match_candidates]
+        self._match_lengths = [len(name) for name in self._match_names]
+        # Normalized name -> first candidate with that name, for exact
+        # case-insensitive matches that need no fuzzy scoring
+        self._match_index = {}
+        for idx, name in enumerate(self._match_names):
+            self._match_index.setdefault(name, idx)
+        self._trigram_index = self._build_trigram_index(self._match_names)
     
     def _load_business_terms(self, terms_path: str) -> Dict[str, Any]:
         """Load business terms from YAML configuration."""
-        with open(terms_path, 'r') as f:
-            return yaml.safe_load(f)
+        terms, self._glossary_hash = _load_business_terms_with_hash(terms_path)
+        return terms
+    
+    def _build_match_candidates(self, terms: Dict[str, Any]) -> List[tuple]:
+        """
+        Normalize term keys and business names once for fuzzy matching.
+        
+        Returns:
+            List of (normalized_name, term_key, term_info), with each term's
+            key followed by its business name
+        """
+        candidates = []
+        
+        for term_key, term_info in terms.items():
+            candidates.append((term_key.lower(), term_key, term_info))
+            
+            business_name = term_info.get('business_name', '')
+            if business_name:
+                # Create comparable version (lowercase, remove spaces)
+                candidates.append((business_name.lower().replace(' ', '_'), term_key, term_info))
+        
+        return candidates
+    
+    def _build_trigram_index(self, names: List[str]) -> Dict[str, List[tuple]]:
+        """
+        Build an inverted index from character trigrams to match candidates.
+        
+        Returns:
+            Dictionary mapping each trigram to (candidate_index, occurrences) pairs
+        """
+        index = {}
+        
+        for idx, name in enumerate(names):
+            for gram, count in _trigrams(name).items():
+                index.setdefault(gram, []).append((idx, count))
+        
+        return index
     
-    def map_columns(self, columns: List[str], dataset_name: str) -> Dict[str, Dict[str, Any]]:
+    def _fuzzy_candidates(self, name: str, threshold: float) -> List[int]:
+        """
+        Select the match candidates that can reach the similarity threshold.
+        
+        Both filters are lossless for SequenceMatcher.ratio(): a candidate is
+        only dropped if its length, or the trigrams it shares with the name
+        (q-gram lemma), rule out a ratio of at least the threshold.
+        
+        Args:
+            name: Normalized technical column name
+            threshold: Minimum similarity ratio
+            
+        Returns:
+            Indices into the match candidates
+        """
+        shared = Counter()
+        for gram, count in _trigrams(name).items():
+            for idx, candidate_count in self._trigram_index.get(gram, ()):
+                shared[idx] += min(count, candidate_count)
+        
+        name_len = len(name)
+        candidates = []
+        
+        for idx, candidate_len in enumerate(self._match_lengths):
+            total_len = name_len + candidate_len
+            
+            # ratio = 2 * matches / total_len, and matches <= the shorter length
+            if 2 * min(name_len, candidate_len) < threshold * total_len - 1e-9:
+                continue
+            
+            # A ratio >= threshold allows at most this many edits, and each
+            # edit destroys at most 3 of the longer string's trigrams
+            max_edits = int((1 - threshold) * total_len + 1e-9)
+            if shared[idx] >= max(name_len, candidate_len) - 2 - 3 * max_edits:
+                candidates.append(idx)
+        
+        return candidates
+    
+    def map_columns(self, columns: List[str], dataset_name: str) -> Dict[str, ColumnMapping]:
         """
         Map technical column names to business terms.
         
@@ -42,102 +318,263 @@ class TermMapper:
             dataset_name: Name of the dataset
             
         Returns:
-            Dictionary mapping column names to business information
+            Dictionary mapping column names to their ColumnMapping
         """
-        print(f"Mapping columns for dataset: {dataset_name}")
+        logger.info("Mapping columns for dataset: %s", dataset_name)
+        
+        # Mapping only depends on the columns, the glossary and the glossary
+        # settings, so an unchanged dataset reuses the result of an earlier
+        # run. Mappings are rebuilt from the cache on every read, so editing
+        # one dataset's mappings never changes another's
+        cache_key = self._mapping_cache_key(columns)
+        cached = self._load_mapping_cache().get(cache_key)
+        if cached is not None:
+            try:
+                mappings = {col: self._mapping_from_cache(entry) for col, entry in cached.items()}
+            except (AttributeError, KeyError, TypeError):
+                pass
+            else:
+                return self._store_mappings(dataset_name, mappings)
         
-        mappings = {}
         terms = self.business_terms.get('terms', {})
+        auto_mapping = self.config.get('glossary', {}).get('auto_mapping', True)
+        
+        # Columns without a direct match are fuzzy matched together
+        fuzzy_columns = [col for col in columns if col not in terms] if auto_mapping else []
+        fuzzy_matches = dict(zip(fuzzy_columns, self._find_fuzzy_matches(fuzzy_columns)))
+        
+        mappings = {}
         
         for col in columns:
             # Direct match
             if col in terms:
                 mappings[col] = self._create_mapping(col, terms[col], match_type='exact')
             else:
-                # Try fuzzy matching
-                if self.config.get('glossary', {}).get('auto_mapping', True):
-                    fuzzy_match = self._find_fuzzy_match(col, terms)
-                    if fuzzy_match:
-                        mappings[col] = fuzzy_match
-                    else:
-                        mappings[col] = self._create_unmapped_entry(col)
+                fuzzy_match = fuzzy_matches.get(col)
+                if fuzzy_match:
+                    mappings[col] = fuzzy_match
                 else:
                     mappings[col] = self._create_unmapped_entry(col)
         
+        self._save_mapping_cache(cache_key, mappings)
+        
+        return self._store_mappings(dataset_name, mappings)
+    
+    def _load_mapping_cache(self) -> Dict[str, Any]:
+        """Read the persisted map_columns results, once per TermMapper."""
+        if self._mapping_cache is None:
+            try:
+                cache = _json_loads(self._mapping_cache_path.read_bytes())
+            except (OSError, ValueError):
+                cache = {}
+            self._mapping_cache = cache if isinstance(cache, dict) else {}
+        return self._mapping_cache
+    
+    def _save_mapping_cache(self, cache_key: str, mappings: Dict[str, ColumnMapping]) -> None:
+        """Add a map_columns result to the persisted cache."""
+        cache = self._load_mapping_cache()
+        cache[cache_key] = {col: self._mapping_to_cache(mapping) for col, mapping in mappings.items()}
+        while len(cache) > MAPPING_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        
+        try:
+            _write_atomic(self._mapping_cache_path, json.dumps(cache))
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def _mapping_to_cache(self, mapping: ColumnMapping) -> Dict[str, Any]:
+        """Convert a mapping to its cache entry; term_info is looked up again on load."""
+        return {f.name: getattr(mapping, f.name) for f in fields(ColumnMapping) if f.name != 'term_info'}
+    
+    def _mapping_from_cache(self, entry: Dict[str, Any]) -> ColumnMapping:
+        """Rebuild a mapping from its cache entry, linking its glossary term."""
+        mapping = ColumnMapping(**entry)
+        if mapping.mapped:
+            term_key = mapping.matched_term if mapping.match_type == 'fuzzy' else mapping.technical_name
+            mapping.term_info = self.business_terms['terms'][term_key]
+        return mapping
+    
+    def _mapping_cache_key(self, columns: List[str]) -> str:
+        """Build the map_columns cache key from its inputs."""
+        glossary_config = json.dumps(self.config.get('glossary', {}), sort_keys=True, default=str)
+        signature = repr((tuple(columns), self._glossary_hash, glossary_config))
+        return hashlib.sha1(signature.encode()).hexdigest()
+    
+    def _store_mappings(self, dataset_name: str,
+                        mappings: Dict[str, ColumnMapping]) -> Dict[str, ColumnMapping]:
+        """Store a dataset's mappings along with its PII and owner groupings."""
         self.mappings[dataset_name] = mappings
+        
+        # Group columns once here so the PII and owner lookups are dict reads
+        pii_columns = []
+        column_owners = {}
+        for col, mapping in mappings.items():
+            if mapping.is_pii:
+                pii_columns.append(col)
+            owner = mapping.owner if mapping.mapped else 'Unassigned'
+            column_owners.setdefault(owner, []).append(col)
+        
+        self.pii_columns[dataset_name] = pii_columns
+        self.column_owners[dataset_name] = column_owners
         return mappings
     
     def _create_mapping(self, technical_name: str, business_info: Dict[str, Any], 
-                       match_type: str = 'exact') -> Dict[str, Any]:
+                       match_type: str = 'exact') -> ColumnMapping:
         """Create a complete mapping entry."""
-        return {
-            'technical_name': technical_name,
-            'business_name': business_info.get('business_name', technical_name),
-            'definition': business_info.get('definition', ''),
-            'data_type': business_info.get('data_type', ''),
-            'format': business_info.get('format', ''),
-            'examples': business_info.get('examples', []),
-            'owner': business_info.get('owner', ''),
-            'related_terms': business_info.get('related_terms', []),
-            'is_pii': business_info.get('pii', False),
-            'valid_values': business_info.get('valid_values', []),
-            'match_type': match_type,
-            'mapped': True
-        }
+        return ColumnMapping(
+            technical_name=technical_name,
+            business_name=business_info.get('business_name', technical_name),
+            definition=business_info.get('definition', ''),
+            owner=business_info.get('owner', ''),
+            is_pii=business_info.get('pii', False),
+            match_type=match_type,
+            mapped=True,
+            term_info=business_info,
+        )
     
-    def _find_fuzzy_match(self, technical_name: str, 
-                         terms: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _find_fuzzy_match(self, technical_name: str) -> Optional[ColumnMapping]:
         """
-        Find fuzzy match for a technical column name.
+        Find fuzzy match for a technical column name against the business terms.
         
         Args:
             technical_name: Technical column name
-            terms: Dictionary of business terms
             
         Returns:
             Mapping dictionary if match found, None otherwise
         """
-        threshold = self.config.get('glossary', {}).get('similarity_threshold', 0.8)
+        return self._find_fuzzy_matches([technical_name])[0]
+    
+    def _find_fuzzy_matches(self, technical_names: List[str]) -> List[Optional[ColumnMapping]]:
+        """
+        Find fuzzy matches for several technical column names at once.
         
-        best_match = None
-        best_score = 0
+        Names equal to a candidate after normalization match it directly.
+        The rest are scored with difflib's SequenceMatcher.ratio(), so
+        results do not depend on whether rapidfuzz is installed. With
+        rapidfuzz, one parallel cdist call first rules out the candidates
+        below the threshold: its ratio is 2 * LCS / total length, never less
+        than difflib's, so no candidate that difflib would accept is lost.
+        Ties keep the first candidate in every case.
         
-        for term_key, term_info in terms.items():
-            # Compare with term key
-            score = SequenceMatcher(None, technical_name.lower(), term_key.lower()).ratio()
+        Args:
+            technical_names: Technical column names
             
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = (term_key, term_info)
+        Returns:
+            ColumnMapping or None for each name, in the same order
+        """
+        threshold = self.config.get('glossary', {}).get('similarity_threshold', 0.8)
+        
+        matches = [None] * len(technical_names)
+        pending = []
+        
+        for position, name in enumerate(technical_names):
+            idx = self._match_index.get(name.lower())
+            if idx is not None:
+                # Identical after normalization: scores 1.0, so skip scoring
+                _, term_key, term_info = self._match_candidates[idx]
+                matches[position] = self._create_fuzzy_mapping(name, term_key, term_info, 1.0)
+            else:
+                pending.append(position)
+        
+        if not pending or not self._match_names:
+            return matches
+        
+        pending_names = [technical_names[position] for position in pending]
+        candidates = None
+        if process is not None:
+            # The cutoff is lowered slightly so rounding in rapidfuzz cannot
+            # drop a candidate difflib scores exactly at the threshold
+            scores = process.cdist(
+                [name.lower() for name in pending_names], self._match_names,
+                scorer=fuzz.ratio, score_cutoff=max(threshold * 100 - 1e-6, 0),
+                dtype=np.float64, workers=-1
+            )
+            candidates = [np.flatnonzero(row > 0).tolist() for row in scores]
+        
+        difflib_matches = self._difflib_matches(pending_names, threshold, candidates)
+        for position, match in zip(pending, difflib_matches):
+            matches[position] = match
+        
+        return matches
+    
+    def _difflib_matches(self, technical_names: List[str], threshold: float,
+                         candidates: Optional[List[List[int]]] = None) -> List[Optional[ColumnMapping]]:
+        """
+        Find the best fuzzy match for each column name with difflib.
+        
+        Candidates are the outer loop so one SequenceMatcher keeps each
+        candidate's lookup tables (built from seq2) for all the columns
+        compared with it; only seq1 changes between comparisons.
+        
+        Args:
+            technical_names: Technical column names
+            threshold: Minimum similarity ratio
+            candidates: Candidate indices worth scoring for each name;
+                defaults to the length and trigram filters of _fuzzy_candidates
+        """
+        lowered = [name.lower() for name in technical_names]
+        best_scores = [0] * len(technical_names)
+        best_indices = [None] * len(technical_names)
+        
+        if candidates is None:
+            candidates = [self._fuzzy_candidates(name, threshold) for name in lowered]
+        
+        # Candidate index -> positions of the columns that can match it
+        columns_by_candidate = {}
+        for position, name_candidates in enumerate(candidates):
+            for idx in name_candidates:
+                columns_by_candidate.setdefault(idx, []).append(position)
+        
+        matcher = SequenceMatcher(None, autojunk=False)
+        
+        for idx in sorted(columns_by_candidate):
+            matcher.set_seq2(self._match_names[idx])
             
-            # Also compare with business name if available
-            business_name = term_info.get('business_name', '')
-            if business_name:
-                # Create comparable version (lowercase, remove spaces)
-                comparable_name = business_name.lower().replace(' ', '_')
-                score = SequenceMatcher(None, technical_name.lower(), comparable_name).ratio()
+            for position in columns_by_candidate[idx]:
+                best_score = best_scores[position]
+                if best_score == 1.0:
+                    continue
+                
+                matcher.set_seq1(lowered[position])
                 
+                # quick_ratio() is a cheap upper bound on ratio(), so
+                # candidates that cannot beat the cutoff skip the full comparison
+                upper_bound = matcher.quick_ratio()
+                if upper_bound < threshold or upper_bound <= best_score:
+                    continue
+                
+                score = matcher.ratio()
                 if score > best_score and score >= threshold:
-                    best_score = score
-                    best_match = (term_key, term_info)
+                    best_scores[position] = score
+                    best_indices[position] = idx
         
-        if best_match:
-            mapping = self._create_mapping(technical_name, best_match[1], match_type='fuzzy')
-            mapping['fuzzy_match_score'] = best_score
-            mapping['matched_term'] = best_match[0]
-            return mapping
+        matches = []
+        for name, idx, score in zip(technical_names, best_indices, best_scores):
+            if idx is None:
+                matches.append(None)
+            else:
+                _, term_key, term_info = self._match_candidates[idx]
+                matches.append(self._create_fuzzy_mapping(name, term_key, term_info, score))
         
-        return None
+        return matches
     
-    def _create_unmapped_entry(self, technical_name: str) -> Dict[str, Any]:
+    def _create_fuzzy_mapping(self, technical_name: str, term_key: str,
+                              term_info: Dict[str, Any], score: float) -> ColumnMapping:
+        """Create a mapping entry for a fuzzy match."""
+        mapping = self._create_mapping(technical_name, term_info, match_type='fuzzy')
+        mapping.fuzzy_match_score = score
+        mapping.matched_term = term_key
+        return mapping
+    
+    def _create_unmapped_entry(self, technical_name: str) -> ColumnMapping:
         """Create entry for unmapped column."""
-        return {
-            'technical_name': technical_name,
-            'business_name': technical_name.replace('_', ' ').title(),
-            'definition': 'No business definition available',
-            'mapped': False,
-            'match_type': 'none'
-        }
+        return ColumnMapping(
+            technical_name=technical_name,
+            business_name=_default_business_name(technical_name),
+            definition='No business definition available',
+            mapped=False,
+            match_type='none',
+        )
     
     def get_business_glossary(self, dataset_name: str) -> Dict[str, Any]:
         """
@@ -152,12 +589,15 @@ class TermMapper:
         if dataset_name not in self.mappings:
             raise ValueError(f"No mappings found for dataset: {dataset_name}")
         
+        mappings = self.mappings[dataset_name]
+        mapped = sum(1 for m in mappings.values() if m.mapped)
+        
         glossary = {
             'dataset_name': dataset_name,
-            'total_columns': len(self.mappings[dataset_name]),
-            'mapped_columns': sum(1 for m in self.mappings[dataset_name].values() if m['mapped']),
-            'unmapped_columns': sum(1 for m in self.mappings[dataset_name].values() if not m['mapped']),
-            'terms': self.mappings[dataset_name]
+            'total_columns': len(mappings),
+            'mapped_columns': mapped,
+            'unmapped_columns': len(mappings) - mapped,
+            'terms': {col: mapping.to_dict() for col, mapping in mappings.items()}
         }
         
         return glossary
@@ -181,32 +621,32 @@ class TermMapper:
             f"\nBusiness Glossary Report: {dataset_name}",
             "=" * 80,
             f"\nTotal Columns: {len(mappings)}",
-            f"Mapped: {sum(1 for m in mappings.values() if m['mapped'])}",
-            f"Unmapped: {sum(1 for m in mappings.values() if not m['mapped'])}",
+            f"Mapped: {sum(1 for m in mappings.values() if m.mapped)}",
+            f"Unmapped: {sum(1 for m in mappings.values() if not m.mapped)}",
             "\n" + "=" * 80,
             "\nColumn Definitions:",
             "-" * 80,
         ]
         
         for col_name, mapping in mappings.items():
-            report_lines.append(f"\n{mapping['business_name']} ({col_name})")
-            report_lines.append(f"  Definition: {mapping['definition']}")
+            report_lines.append(f"\n{mapping.business_name} ({col_name})")
+            report_lines.append(f"  Definition: {mapping.definition}")
             
-            if mapping.get('data_type'):
-                report_lines.append(f"  Data Type: {mapping['data_type']}")
+            if mapping.data_type:
+                report_lines.append(f"  Data Type: {mapping.data_type}")
             
-            if mapping.get('owner'):
-                report_lines.append(f"  Owner: {mapping['owner']}")
+            if mapping.owner:
+                report_lines.append(f"  Owner: {mapping.owner}")
             
-            if mapping.get('examples'):
-                examples = ', '.join(str(e) for e in mapping['examples'][:3])
+            if mapping.examples:
+                examples = ', '.join(str(e) for e in mapping.examples[:3])
                 report_lines.append(f"  Examples: {examples}")
             
-            if mapping.get('is_pii'):
+            if mapping.is_pii:
                 report_lines.append(f"  ⚠️  Contains PII")
             
-            if mapping.get('match_type') == 'fuzzy':
-                report_lines.append(f"  (Fuzzy match: {mapping.get('fuzzy_match_score', 0):.2f})")
+            if mapping.match_type == 'fuzzy':
+                report_lines.append(f"  (Fuzzy match: {mapping.fuzzy_match_score or 0:.2f})")
             
             report_lines.append("-" * 80)
         
@@ -222,15 +662,7 @@ class TermMapper:
         Returns:
             List of column names containing PII
         """
-        if dataset_name not in self.mappings:
-            return []
-        
-        pii_columns = [
-            col for col, mapping in self.mappings[dataset_name].items()
-            if mapping.get('is_pii', False)
-        ]
-        
-        return pii_columns
+        return list(self.pii_columns.get(dataset_name, []))
     
     def get_columns_by_owner(self, dataset_name: str) -> Dict[str, List[str]]:
         """
@@ -242,18 +674,10 @@ class TermMapper:
         Returns:
             Dictionary mapping owners to their columns
         """
-        if dataset_name not in self.mappings:
-            return {}
-        
-        owners = {}
-        
-        for col, mapping in self.mappings[dataset_name].items():
-            owner = mapping.get('owner', 'Unassigned')
-            if owner not in owners:
-                owners[owner] = []
-            owners[owner].append(col)
-        
-        return owners
+        return {
+            owner: list(columns)
+            for owner, columns in self.column_owners.get(dataset_name, {}).items()
+        }
     
     def export_glossary(self, dataset_name: str, output_path: Path, 
                        format: str = 'json') -> None:
@@ -268,38 +692,58 @@ class TermMapper:
         if dataset_name not in self.mappings:
             raise ValueError(f"No mappings found for dataset: {dataset_name}")
         
-        glossary = self.get_business_glossary(dataset_name)
-        
         if format == 'json':
+            glossary = self.get_business_glossary(dataset_name)
             output_file = output_path / f"{dataset_name}_glossary.json"
-            with open(output_file, 'w') as f:
-                json.dump(glossary, f, indent=2)
+            if orjson is not None:
+                output_file.write_bytes(orjson.dumps(
+                    glossary,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                # Match orjson's output: UTF-8 text rather than \u escapes
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(glossary, f, indent=2, ensure_ascii=False)
         
         elif format == 'yaml':
+            glossary = self.get_business_glossary(dataset_name)
             output_file = output_path / f"{dataset_name}_glossary.yaml"
             with open(output_file, 'w') as f:
-                yaml.dump(glossary, f, default_flow_style=False)
+                yaml.dump(glossary, f, Dumper=SafeDumper, default_flow_style=False)
         
         elif format == 'csv':
             output_file = output_path / f"{dataset_name}_glossary.csv"
             
-            # Flatten mappings for CSV
-            rows = []
-            for col, mapping in glossary['terms'].items():
-                rows.append({
-                    'Technical Name': mapping['technical_name'],
-                    'Business Name': mapping['business_name'],
-                    'Definition': mapping['definition'],
-                    'Data Type': mapping.get('data_type', ''),
-                    'Owner': mapping.get('owner', ''),
-                    'Is PII': mapping.get('is_pii', False),
-                    'Mapped': mapping['mapped']
-                })
+            # Flatten mappings for CSV, one list per column. Flags are written
+            # as True/False text, as pandas writes them.
+            mappings = self.mappings[dataset_name].values()
+            columns = {
+                'Technical Name': [m.technical_name for m in mappings],
+                'Business Name': [m.business_name for m in mappings],
+                'Definition': [m.definition for m in mappings],
+                'Data Type': [m.data_type for m in mappings],
+                'Owner': [m.owner for m in mappings],
+                'Is PII': [str(m.is_pii) for m in mappings],
+                'Mapped': [str(m.mapped) for m in mappings],
+            }
             
-            df = pd.DataFrame(rows)
-            df.to_csv(output_file, index=False)
+            # Arrow's C++ writer is used unless pyarrow is missing or a column
+            # holds values that are not text. It quotes every field, where
+            # pandas quotes only those containing commas, quotes or newlines;
+            # the parsed values are the same either way
+            table = None
+            if pa is not None:
+                try:
+                    table = pa.Table.from_pydict(columns)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass
+            
+            if table is not None:
+                pa_csv.write_csv(table, output_file)
+            else:
+                pd.DataFrame(columns).to_csv(output_file, index=False)
         
-        print(f"Glossary exported to: {output_file}")
+        logger.info("Glossary exported to: %s", output_file)
     
     def validate_mappings(self, dataset_name: str) -> Dict[str, Any]:
         """
@@ -316,18 +760,18 @@ class TermMapper:
         
         mappings = self.mappings[dataset_name]
         total = len(mappings)
-        mapped = sum(1 for m in mappings.values() if m['mapped'])
+        mapped = sum(1 for m in mappings.values() if m.mapped)
         
         # Check for columns missing definitions
         missing_definitions = [
             col for col, m in mappings.items()
-            if not m.get('definition') or m['definition'] == 'No business definition available'
+            if not m.definition or m.definition == 'No business definition available'
         ]
         
         # Check for columns missing owners
         missing_owners = [
             col for col, m in mappings.items()
-            if not m.get('owner')
+            if not m.owner
         ]
         
         validation = {
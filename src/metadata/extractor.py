@@ -4,11 +4,35 @@ Extracts and manages technical metadata from datasets.
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import json
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Integer SQL types by column maximum: below 32768, below 2**31, larger
+INT_SQL_TYPE_BOUNDS = (32768, 2147483648)
+INT_SQL_TYPES = ('SMALLINT', 'INTEGER', 'BIGINT')
+
+# Rows checked at each end of a column before a full sortedness scan
+SORT_CHECK_SAMPLE_SIZE = 64
+
 
 class MetadataExtractor:
     """
@@ -38,14 +62,31 @@ class MetadataExtractor:
         Returns:
             Dictionary containing metadata
         """
-        print(f"Extracting metadata for: {dataset_name}")
+        logger.info("Extracting metadata for: %s", dataset_name)
+        
+        extraction_timestamp = datetime.now().isoformat()
+        
+        # The schema, statistics and technical passes only read df, and the
+        # pandas reductions they run release the GIL, so they run in threads
+        if self.config.get('metadata', {}).get('parallel', True):
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                schema = executor.submit(self._extract_schema, df)
+                statistics = executor.submit(self._extract_statistics, df)
+                technical_metadata = executor.submit(self._extract_technical_metadata, df)
+                schema, statistics, technical_metadata = (
+                    schema.result(), statistics.result(), technical_metadata.result()
+                )
+        else:
+            schema = self._extract_schema(df)
+            statistics = self._extract_statistics(df)
+            technical_metadata = self._extract_technical_metadata(df)
         
         metadata = {
             'dataset_name': dataset_name,
-            'extraction_timestamp': datetime.now().isoformat(),
-            'schema': self._extract_schema(df),
-            'statistics': self._extract_statistics(df),
-            'technical_metadata': self._extract_technical_metadata(df),
+            'extraction_timestamp': extraction_timestamp,
+            'schema': schema,
+            'statistics': statistics,
+            'technical_metadata': technical_metadata,
         }
         
         if source_info:
@@ -65,29 +106,31 @@ class MetadataExtractor:
     def _extract_schema(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Extract schema information for each column."""
         schema = []
+        nullable = df.isnull().any()
+        sql_types = self._infer_sql_types(df)
         
-        for col in df.columns:
+        for position, (col, series) in enumerate(df.items(), start=1):
             col_info = {
                 'column_name': col,
-                'data_type': str(df[col].dtype),
-                'nullable': bool(df[col].isnull().any()),
-                'is_unique': bool(df[col].is_unique),
-                'position': list(df.columns).index(col) + 1,
+                'data_type': str(series.dtype),
+                'nullable': bool(nullable[col]),
+                'is_unique': bool(series.is_unique),
+                'position': position,
             }
             
             # Infer additional type information
-            if pd.api.types.is_numeric_dtype(df[col]):
+            if pd.api.types.is_numeric_dtype(series):
                 col_info['python_type'] = 'numeric'
-                col_info['sql_type'] = self._infer_sql_type(df[col])
-            elif pd.api.types.is_datetime64_any_dtype(df[col]):
+                col_info['sql_type'] = sql_types[col]
+            elif pd.api.types.is_datetime64_any_dtype(series):
                 col_info['python_type'] = 'datetime'
                 col_info['sql_type'] = 'TIMESTAMP'
-            elif pd.api.types.is_bool_dtype(df[col]):
+            elif pd.api.types.is_bool_dtype(series):
                 col_info['python_type'] = 'boolean'
                 col_info['sql_type'] = 'BOOLEAN'
             else:
                 col_info['python_type'] = 'string'
-                max_length = df[col].astype(str).str.len().max()
+                max_length = self._max_string_length(series)
                 col_info['sql_type'] = f'VARCHAR({int(max_length)})' if max_length else 'VARCHAR(255)'
                 col_info['max_length'] = int(max_length) if max_length else None
             
@@ -95,6 +138,29 @@ class MetadataExtractor:
         
         return schema
     
+    def _max_string_length(self, series: pd.Series) -> Optional[int]:
+        """
+        Find the longest value of a column as text, as astype(str) would give it.
+        
+        String columns are measured with pyarrow's utf8_length kernel instead
+        of copying every value into a new string array; missing values count
+        as their text form ('None', 'nan', ...). Other columns, and columns
+        with non-string values, fall back to astype(str).
+        """
+        if pa is not None and (series.dtype == object or pd.api.types.is_string_dtype(series.dtype)):
+            try:
+                values = pa.array(series, type=pa.large_string(), from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                values = None
+            
+            if values is not None:
+                lengths = [pc.max(pc.utf8_length(values)).as_py() or 0]
+                if values.null_count:
+                    lengths.extend(len(str(value)) for value in pd.unique(series[series.isna()]))
+                return max(lengths)
+        
+        return series.astype(str).str.len().max()
+    
     def _infer_sql_type(self, series: pd.Series) -> str:
         """Infer SQL data type from pandas series."""
         dtype = str(series.dtype)
@@ -112,6 +178,35 @@ class MetadataExtractor:
         else:
             return 'NUMERIC'
     
+    def _infer_sql_types(self, df: pd.DataFrame) -> Dict[str, str]:
+        """
+        Infer SQL data types for all numeric columns of a DataFrame.
+        
+        Gives the same types as _infer_sql_type, but takes the maxima of all
+        integer columns in one call and buckets them together.
+        """
+        sql_types = {}
+        int_cols = []
+        
+        for col, dtype in df.dtypes.items():
+            if not pd.api.types.is_numeric_dtype(dtype):
+                continue
+            
+            dtype_name = str(dtype)
+            if 'int' in dtype_name:
+                int_cols.append(col)
+            elif 'float' in dtype_name:
+                sql_types[col] = 'DECIMAL(18,2)'
+            else:
+                sql_types[col] = 'NUMERIC'
+        
+        if int_cols:
+            maxima = df[int_cols].max().to_numpy(dtype=float)
+            buckets = np.digitize(maxima, INT_SQL_TYPE_BOUNDS)
+            sql_types.update(zip(int_cols, (INT_SQL_TYPES[bucket] for bucket in buckets)))
+        
+        return sql_types
+    
     def _extract_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Extract statistical metadata."""
         stats = {
@@ -122,20 +217,34 @@ class MetadataExtractor:
             'column_statistics': {}
         }
         
+        # Each statistic is computed for all columns in one vectorized call
+        counts = df.count()
+        null_counts = len(df) - counts
+        unique_counts = df.nunique()
+        
+        numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+        numeric_df = df[numeric_cols]
+        numeric_stats = {
+            'min': numeric_df.min(),
+            'max': numeric_df.max(),
+            'mean': numeric_df.mean(),
+            'median': numeric_df.median(),
+            'std': numeric_df.std(),
+        }
+        numeric_cols = set(numeric_cols)
+        
         for col in df.columns:
             col_stats = {
-                'count': int(df[col].count()),
-                'null_count': int(df[col].isnull().sum()),
-                'unique_count': int(df[col].nunique()),
+                'count': int(counts[col]),
+                'null_count': int(null_counts[col]),
+                'unique_count': int(unique_counts[col]),
             }
             
-            if pd.api.types.is_numeric_dtype(df[col]):
+            if col in numeric_cols:
+                all_null = counts[col] == 0
                 col_stats.update({
-                    'min': float(df[col].min()) if not df[col].isnull().all() else None,
-                    'max': float(df[col].max()) if not df[col].isnull().all() else None,
-                    'mean': float(df[col].mean()) if not df[col].isnull().all() else None,
-                    'median': float(df[col].median()) if not df[col].isnull().all() else None,
-                    'std': float(df[col].std()) if not df[col].isnull().all() else None,
+                    name: float(values[col]) if not all_null else None
+                    for name, values in numeric_stats.items()
                 })
             
             stats['column_statistics'][col] = col_stats
@@ -154,17 +263,36 @@ class MetadataExtractor:
         }
     
     def _check_if_sorted(self, df: pd.DataFrame) -> Optional[str]:
-        """Check if DataFrame is sorted by any column."""
-        for col in df.columns:
+        """
+        Check if DataFrame is sorted by any column.
+        
+        The first and last rows of a column are checked before scanning it,
+        so unsorted columns are usually rejected without a full pass.
+        """
+        for col, series in df.items():
             try:
-                if df[col].is_monotonic_increasing:
+                if self._may_be_monotonic(series, increasing=True) and series.is_monotonic_increasing:
                     return f"ascending by {col}"
-                elif df[col].is_monotonic_decreasing:
+                elif self._may_be_monotonic(series, increasing=False) and series.is_monotonic_decreasing:
                     return f"descending by {col}"
             except TypeError:
                 continue
         return None
     
+    def _may_be_monotonic(self, series: pd.Series, increasing: bool) -> bool:
+        """Return False if the head and tail of a series show it is not monotonic."""
+        if len(series) <= 2 * SORT_CHECK_SAMPLE_SIZE:
+            return True
+        
+        head = series.head(SORT_CHECK_SAMPLE_SIZE)
+        tail = series.tail(SORT_CHECK_SAMPLE_SIZE)
+        
+        if increasing:
+            return bool(head.is_monotonic_increasing and tail.is_monotonic_increasing
+                        and head.iloc[-1] <= tail.iloc[0])
+        return bool(head.is_monotonic_decreasing and tail.is_monotonic_decreasing
+                    and head.iloc[-1] >= tail.iloc[0])
+    
     def _extract_lineage(self, dataset_name: str, 
                         source_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -220,7 +348,7 @@ class MetadataExtractor:
                 col_schema['is_pii'] = business_info.get('pii', False)
                 col_schema['related_terms'] = business_info.get('related_terms', [])
         
-        print(f"Enriched metadata for {dataset_name} with business context")
+        logger.info("Enriched metadata for %s with business context", dataset_name)
     
     def generate_schema_ddl(self, dataset_name: str, table_name: str, 
                            dialect: str = 'postgresql') -> str:
@@ -257,23 +385,38 @@ class MetadataExtractor:
         
         return '\n'.join(ddl_lines)
     
-    def save_metadata(self, dataset_name: str, output_path: Path) -> None:
+    def save_metadata(self, dataset_name: str, output_path: Path, pretty: bool = False) -> None:
         """
         Save metadata to JSON file.
         
         Args:
             dataset_name: Name of the dataset
             output_path: Directory to save metadata
+            pretty: Indent the output for human readers; compact output is
+                smaller and needs less memory to write
         """
-        if dataset_name not in self.metadata_store:
+        metadata = self.metadata_store.get(dataset_name)
+        if metadata is None:
             raise ValueError(f"No metadata found for dataset: {dataset_name}")
         
         output_file = output_path / f"{dataset_name}_metadata.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(self.metadata_store[dataset_name], f, indent=2)
-        
-        print(f"Metadata saved to: {output_file}")
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            output_file.write_bytes(orjson.dumps(metadata, option=option))
+        else:
+            # Match orjson's output: UTF-8 text rather than \u escapes.
+            # json.dump writes to the file in chunks as it encodes.
+            with open(output_file, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(metadata, f, separators=(',', ':'), ensure_ascii=False)
+                f.write('\n')
+        
+        logger.info("Metadata saved to: %s", output_file)
     
     def export_to_catalog(self, dataset_name: str, catalog_format: str = 'json') -> Dict[str, Any]:
         """
@@ -7,10 +7,199 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+import gzip
 import json
-from typing import Dict, List, Any, Optional
+import logging
+import os
+import re
+from typing import Dict, List, Any, Optional, Iterable, Callable, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from collections.abc import Mapping
+from functools import partial
 # from ydata_profiling import ProfileReport  # Optional: install separately
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# dtype.kind codes treated as numeric (same set pd.api.types.is_numeric_dtype accepts)
+NUMERIC_KINDS = 'iufcb'
+
+# Values parsed before (and at most during) the numeric-stored-as-string check
+NUMERIC_STRING_SAMPLE_SIZE = 1000
+NUMERIC_STRING_MAX_ROWS = 1_000_000
+
+# profiling.memory_usage 'auto' estimates object column sizes from a sample
+# on frames above either size
+MEMORY_ESTIMATE_MIN_CELLS = 10_000_000
+MEMORY_ESTIMATE_MIN_COLUMNS = 1000
+MEMORY_SAMPLE_ROWS = 1000
+
+# Frames with fewer columns are profiled serially
+PARALLEL_MIN_COLUMNS = 16
+
+# StreamingProfiler keeps the smallest value hashes of each column to count
+# distinct values (exact up to this many), and the counts of at most this
+# many string values per column for top values
+STREAMING_DISTINCT_SKETCH_SIZE = 4096
+STREAMING_TOP_VALUES_CAPACITY = 10_000
+
+# Value patterns checked against a sample of each string column
+COLUMN_PATTERNS = {
+    'email': re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'),
+    'phone': re.compile(r'^\+?1?\d{9,15}$'),
+    'id_code': re.compile(r'^[A-Z]{3,4}\d{3,4}$'),  # e.g., CUST1001, ORD001
+    'url': re.compile(r'^https?://[^\s]+$'),
+}
+
+
+def _numeric_moments(values: np.ndarray) -> tuple:
+    """
+    Count, zero count, min, max, mean and sum of squared deviations of the
+    non-NaN values, in two passes over the array without temporaries.
+    """
+    count = 0
+    zeros = 0
+    min_value = np.inf
+    max_value = -np.inf
+    total = 0.0
+    
+    for value in values:
+        if np.isnan(value):
+            continue
+        count += 1
+        total += value
+        if value == 0:
+            zeros += 1
+        if value < min_value:
+            min_value = value
+        if value > max_value:
+            max_value = value
+    
+    mean = total / count if count else np.nan
+    m2 = 0.0
+    for value in values:
+        if not np.isnan(value):
+            m2 += (value - mean) ** 2
+    
+    return count, zeros, min_value, max_value, mean, m2
+
+
+# The kernel is only worth using compiled; without numba the numpy path is used.
+# nogil lets the per-column thread pool run it concurrently.
+_numeric_moments = njit(cache=True, nogil=True)(_numeric_moments) if njit else None
+
+
+def _arrow_value_counts(col_data: pd.Series) -> Optional[pd.Series]:
+    """
+    Count the values of an all-string object column with pyarrow.
+    
+    The strings are copied into one UTF-8 Arrow buffer and counted by Arrow's
+    C++ hash kernel. The result matches ``value_counts(sort=False)``, in order
+    of first appearance. Returns None for columns holding anything but
+    strings, which pandas counts instead.
+    """
+    if pd.api.types.infer_dtype(col_data, skipna=True) != 'string':
+        return None
+    
+    values = pa.array(col_data.to_numpy(), type=pa.string(), from_pandas=True)
+    counts = pc.value_counts(values.drop_null())
+    return pd.Series(
+        counts.field('counts').to_numpy(),
+        index=pd.Index(counts.field('values').to_pandas(), name=col_data.name),
+        name='count',
+    )
+
+
+def _top_counts(value_counts: pd.Series, k: int) -> pd.Series:
+    """
+    Return the k largest counts of an unsorted value_counts() result.
+    
+    A partition finds the k-th largest count, so only the values reaching it
+    are sorted rather than every distinct value. Ties keep first-appearance
+    order.
+    """
+    counts = value_counts.to_numpy()
+    candidates = np.arange(len(counts))
+    if len(counts) > k:
+        kth_largest = np.partition(counts, len(counts) - k)[len(counts) - k]
+        candidates = np.flatnonzero(counts >= kth_largest)
+    order = candidates[np.argsort(-counts[candidates], kind='stable')][:k]
+    return value_counts.iloc[order]
+
+
+def _percentage(part: float, whole: float) -> float:
+    """Return part as a percentage of whole, or 0.0 when whole is zero."""
+    return float(part / whole * 100) if whole else 0.0
+
+
+def _finite_floats(obj: Any) -> Any:
+    """Replace NaN and infinite floats in nested dicts and lists with None."""
+    if isinstance(obj, float):
+        return obj if np.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_floats(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_floats(value) for value in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy types for the standard library JSON encoder."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return _finite_floats(float(obj))
+    if isinstance(obj, np.ndarray):
+        return _finite_floats(obj.tolist())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class CorrelationMatrix(Mapping):
+    """
+    Correlation matrix that reads like ``DataFrame.corr().to_dict()``.
+    
+    The coefficients stay in one float array; ``matrix[col]`` builds that
+    column's {column: r} dict when it is read, so the k*k nested dict is
+    only materialized for the columns callers look at. save_profile writes
+    ``columns`` and ``values`` to the .npz sidecar directly.
+    """
+    
+    __slots__ = ('columns', 'values', '_positions')
+    
+    def __init__(self, columns: List[Any], values: np.ndarray):
+        self.columns = list(columns)
+        self.values = values
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+    
+    def __getitem__(self, col: Any) -> Dict[Any, float]:
+        return dict(zip(self.columns, self.values[:, self._positions[col]].tolist()))
+    
+    def __iter__(self):
+        return iter(self.columns)
+    
+    def __len__(self) -> int:
+        return len(self.columns)
+    
+    def to_dict(self) -> Dict[Any, Dict[Any, float]]:
+        """Build the full nested dict."""
+        return {col: self[col] for col in self.columns}
+
 
 class DataProfiler:
     """
@@ -26,11 +215,23 @@ class DataProfiler:
         """
         self.config = config
         self.profile_results = {}
+        self._null_mask = None
+        self._null_per_col = None
+        self._duplicate_count = 0
+        self._n = 0
+        self._dtypes = None
         
     def profile_dataset(self, df: pd.DataFrame, dataset_name: str) -> Dict[str, Any]:
         """
         Generate comprehensive profile for a dataset.
         
+        Basic info and data quality always cover every row. When
+        ``profiling.sample_size`` is set and the dataset is larger, column
+        profiles, patterns and correlations are computed from a random sample
+        of that many rows and the profile is marked as sampled. Null counts
+        in the column profiles still cover every row, while distinct counts
+        are taken from the sample and marked 'unique_count_estimated'.
+        
         Args:
             df: pandas DataFrame to profile
             dataset_name: Name identifier for the dataset
@@ -38,107 +239,358 @@ class DataProfiler:
         Returns:
             Dictionary containing profiling results
         """
-        print(f"Profiling dataset: {dataset_name}")
+        logger.info("Profiling dataset: %s", dataset_name)
+        
+        profiling_config = self.config.get('profiling', {})
+        sample_size = profiling_config.get('sample_size')
+        
+        self._prepare(df)
+        try:
+            timestamp = datetime.now().isoformat()
+            basic_info = self._get_basic_info(df)
+            data_quality = self._assess_quality(df)
+            
+            sample_df = df
+            null_counts = self._null_per_col
+            if sample_size is not None and len(df) > sample_size:
+                logger.info("Sampling %s of %s rows for column profiles", f"{sample_size:,}", f"{len(df):,}")
+                sample_df = df.sample(n=sample_size, random_state=0)
+                self._prepare(sample_df, duplicates=False)
+            
+            column_profiles = self._profile_columns(sample_df)
+            if sample_df is not df:
+                for col_profile, null_count in zip(column_profiles.values(), null_counts.tolist()):
+                    col_profile['null_count'] = null_count
+                    col_profile['null_percentage'] = _percentage(null_count, len(df))
+                    col_profile['unique_count_estimated'] = True
+            
+            profile = {
+                'dataset_name': dataset_name,
+                'timestamp': timestamp,
+                'basic_info': basic_info,
+                'column_profiles': column_profiles,
+                'data_quality': data_quality,
+                'patterns': self._detect_patterns(sample_df),
+            }
+            
+            if sample_df is not df:
+                profile['sampled'] = True
+                profile['sample_size'] = sample_size
+            
+            if profiling_config.get('correlation_analysis', True):
+                profile['correlations'] = self._analyze_correlations(sample_df)
+        finally:
+            self._clear_prepared()
+        
+        self.profile_results[dataset_name] = profile
+        return profile
+    
+    def profile_chunks(self, chunks: Iterable[pd.DataFrame], 
+                       dataset_name: str) -> Dict[str, Any]:
+        """
+        Profile a dataset delivered as a sequence of DataFrame chunks.
+        
+        Only one chunk is held in memory at a time, so files larger than RAM
+        can be profiled, e.g. with ``pd.read_csv(path, chunksize=...)``.
+        Medians are estimated from a uniform sample of each numeric column,
+        duplicate rows are only counted when ``profiling.streaming_duplicates``
+        is set, and correlation analysis is not available.
+        
+        Args:
+            chunks: Iterable of DataFrames sharing the same columns
+            dataset_name: Name identifier for the dataset
+            
+        Returns:
+            Dictionary containing profiling results
+        """
+        logger.info("Profiling dataset in chunks: %s", dataset_name)
+        
+        streaming = StreamingProfiler(self.config)
+        patterns = None
+        
+        for chunk in chunks:
+            streaming.update(chunk)
+            if patterns is None:
+                patterns = self._detect_patterns(chunk)
         
         profile = {
             'dataset_name': dataset_name,
             'timestamp': datetime.now().isoformat(),
-            'basic_info': self._get_basic_info(df),
-            'column_profiles': self._profile_columns(df),
-            'data_quality': self._assess_quality(df),
-            'patterns': self._detect_patterns(df),
+            'basic_info': streaming.get_basic_info(),
+            'column_profiles': streaming.get_column_profiles(),
+            'data_quality': streaming.get_quality(),
+            'patterns': patterns or {},
         }
         
         if self.config.get('profiling', {}).get('correlation_analysis', True):
-            profile['correlations'] = self._analyze_correlations(df)
+            profile['correlations'] = {
+                'message': 'Correlation analysis is not available for chunked profiling'
+            }
         
         self.profile_results[dataset_name] = profile
         return profile
     
+    def _prepare(self, df: pd.DataFrame, duplicates: bool = True) -> None:
+        """
+        Compute the null mask and duplicate count shared by the profiling passes.
+        
+        Basic info, column profiles and quality assessment all need per-column
+        null counts and the duplicate row count; scanning the frame once here
+        replaces a separate ``isnull()``/``duplicated()`` pass in each of them.
+        
+        Args:
+            df: DataFrame about to be profiled
+            duplicates: Whether to count duplicate rows as well
+        """
+        self._null_mask = df.isnull()
+        self._null_per_col = self._null_mask.sum(axis=0)
+        if duplicates:
+            self._duplicate_count = self._count_duplicates(df)
+        self._n = len(df)
+        self._dtypes = df.dtypes
+    
+    def _count_duplicates(self, df: pd.DataFrame) -> int:
+        """
+        Count rows that repeat an earlier row.
+        
+        By default rows are compared exactly with ``duplicated()``. Setting
+        ``profiling.duplicate_detection`` to 'hash' reduces rows to 64-bit
+        hashes, sorts them and counts equal neighbours instead, which is
+        cheaper on wide frames. Hashing is not exact: it stringifies mixed
+        object values (1 and '1' hash alike) and colliding rows are counted
+        as duplicates.
+        """
+        method = self.config.get('profiling', {}).get('duplicate_detection', 'exact')
+        if method != 'hash':
+            return int(df.duplicated().sum())
+        
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        row_hashes.sort()
+        return int(np.count_nonzero(row_hashes[1:] == row_hashes[:-1]))
+    
+    def _clear_prepared(self) -> None:
+        """Release the cached null mask once a dataset has been profiled."""
+        self._null_mask = None
+        self._null_per_col = None
+        self._duplicate_count = 0
+        self._n = 0
+        self._dtypes = None
+    
     def _get_basic_info(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Extract basic dataset information."""
         return {
-            'row_count': len(df),
+            'row_count': self._n,
             'column_count': len(df.columns),
-            'memory_usage_mb': df.memory_usage(deep=True).sum() / (1024 * 1024),
-            'duplicate_rows': df.duplicated().sum(),
+            'memory_usage_mb': self._memory_usage_bytes(df) / (1024 * 1024),
+            'duplicate_rows': self._duplicate_count,
             'columns': list(df.columns),
-            'dtypes': df.dtypes.astype(str).to_dict()
+            'dtypes': self._dtypes.astype(str).to_dict()
         }
     
+    def _memory_usage_bytes(self, df: pd.DataFrame) -> float:
+        """
+        Measure the memory used by a DataFrame.
+        
+        ``profiling.memory_usage`` selects the method: 'deep' measures every
+        Python object, 'estimate' measures object columns on their first
+        MEMORY_SAMPLE_ROWS rows and scales up, and 'auto' (the default)
+        estimates only for frames of more than MEMORY_ESTIMATE_MIN_CELLS cells
+        or MEMORY_ESTIMATE_MIN_COLUMNS columns.
+        """
+        method = self.config.get('profiling', {}).get('memory_usage', 'auto')
+        if method == 'auto':
+            rows, cols = df.shape
+            large = rows * cols > MEMORY_ESTIMATE_MIN_CELLS or cols > MEMORY_ESTIMATE_MIN_COLUMNS
+            method = 'estimate' if large else 'deep'
+        
+        if method == 'deep' or len(df) <= MEMORY_SAMPLE_ROWS:
+            return float(df.memory_usage(deep=True).sum())
+        
+        # Fixed-width columns are exact without deep=True; only object
+        # columns need their Python objects measured
+        usage = df.memory_usage(deep=False)
+        object_cols = [col for col, dtype in df.dtypes.items() if dtype == object]
+        if not object_cols:
+            return float(usage.sum())
+        
+        sample = df[object_cols].head(MEMORY_SAMPLE_ROWS)
+        sample_bytes = sample.memory_usage(index=False, deep=True).sum()
+        object_bytes = usage[object_cols].sum()
+        return float(usage.sum() - object_bytes + sample_bytes * len(df) / len(sample))
+    
     def _profile_columns(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         """Generate detailed profile for each column."""
-        column_profiles = {}
+        # Null counts come from the prepared mask. Object columns take their
+        # distinct count from value_counts() in _profile_one_column, so only
+        # the other columns are counted here, in one pass
+        null_counts = self._null_per_col.to_numpy().tolist()
+        is_object = [dtype == object for dtype in self._dtypes]
+        other_cols = [i for i, obj in enumerate(is_object) if not obj]
+        other_unique = iter(df.iloc[:, other_cols].nunique().to_numpy().tolist())
+        unique_counts = [None if obj else next(other_unique) for obj in is_object]
         
-        for col in df.columns:
-            col_data = df[col]
-            
-            profile = {
-                'data_type': str(col_data.dtype),
-                'null_count': int(col_data.isnull().sum()),
-                'null_percentage': float(col_data.isnull().sum() / len(df) * 100),
-                'unique_count': int(col_data.nunique()),
-                'unique_percentage': float(col_data.nunique() / len(df) * 100),
-            }
-            
-            # Add statistics for numeric columns
-            if pd.api.types.is_numeric_dtype(col_data):
-                profile.update({
-                    'min': float(col_data.min()) if not col_data.isnull().all() else None,
-                    'max': float(col_data.max()) if not col_data.isnull().all() else None,
-                    'mean': float(col_data.mean()) if not col_data.isnull().all() else None,
-                    'median': float(col_data.median()) if not col_data.isnull().all() else None,
-                    'std': float(col_data.std()) if not col_data.isnull().all() else None,
-                    'zeros_count': int((col_data == 0).sum()),
-                })
-            
-            # Add information for categorical/object columns
-            if pd.api.types.is_object_dtype(col_data) or pd.api.types.is_categorical_dtype(col_data):
-                value_counts = col_data.value_counts()
-                profile.update({
-                    'top_values': value_counts.head(10).to_dict(),
-                    'is_categorical': col_data.nunique() < 50,  # Heuristic for categorical
-                })
-            
-            # Add date-specific information
-            if pd.api.types.is_datetime64_any_dtype(col_data):
-                profile.update({
-                    'min_date': col_data.min().isoformat() if not col_data.isnull().all() else None,
-                    'max_date': col_data.max().isoformat() if not col_data.isnull().all() else None,
-                    'date_range_days': (col_data.max() - col_data.min()).days if not col_data.isnull().all() else None,
-                })
-            
-            # Sample values (non-null)
-            sample_values = col_data.dropna().head(5).tolist()
-            profile['sample_values'] = [str(v) for v in sample_values]
-            
-            column_profiles[col] = profile
+        arrow_strings = pa is not None and self.config.get('profiling', {}).get('arrow_strings', False)
         
-        return column_profiles
+        profiles = self._map_columns(
+            partial(self._profile_one_column, arrow_strings=arrow_strings),
+            [col_data for _, col_data in df.items()],
+            list(self._dtypes),
+            null_counts,
+            unique_counts,
+        )
+        
+        return dict(zip(df.columns, profiles))
+    
+    def _profile_one_column(self, col_data: pd.Series, dtype: Any, null_count: int,
+                            unique_count: Optional[int],
+                            arrow_strings: bool = False) -> Dict[str, Any]:
+        """Generate the profile of a single column."""
+        row_count = self._n
+        kind = dtype.kind
+        
+        # One hash pass over object values serves both the distinct count
+        # and the top values
+        value_counts = None
+        if arrow_strings and dtype == object:
+            value_counts = _arrow_value_counts(col_data)
+        if value_counts is None and (dtype == object or isinstance(dtype, pd.CategoricalDtype)):
+            value_counts = col_data.value_counts(sort=False)
+        if unique_count is None:
+            unique_count = len(value_counts)
+        
+        profile = {
+            'data_type': str(dtype),
+            'null_count': null_count,
+            'null_percentage': _percentage(null_count, row_count),
+            'unique_count': unique_count,
+            'unique_percentage': _percentage(unique_count, row_count),
+        }
+        
+        # Add statistics for numeric columns
+        if kind in NUMERIC_KINDS:
+            profile.update(self._numeric_stats(col_data))
+        
+        # Add information for categorical/object columns
+        if value_counts is not None:
+            profile.update({
+                'top_values': _top_counts(value_counts, 10).to_dict(),
+                'is_categorical': unique_count < 50,  # Heuristic for categorical
+            })
+        
+        # Add date-specific information
+        if kind == 'M':
+            if null_count == row_count:
+                min_date = max_date = None
+            else:
+                min_date, max_date = col_data.min(), col_data.max()
+            profile.update({
+                'min_date': min_date.isoformat() if min_date is not None else None,
+                'max_date': max_date.isoformat() if max_date is not None else None,
+                'date_range_days': (max_date - min_date).days if min_date is not None else None,
+            })
+        
+        # Sample values (non-null), taken from a bounded prefix so the
+        # whole column is only copied when nulls crowd out the first rows
+        if null_count == 0:
+            sample = col_data.head(5)
+        else:
+            sample = col_data.head(200)
+            sample = sample[sample.notna()].head(5)
+            if len(sample) < 5 and row_count - null_count > len(sample):
+                sample = col_data.dropna().head(5)
+        profile['sample_values'] = [str(v) for v in sample.tolist()]
+        
+        return profile
+    
+    def _map_columns(self, func: Callable, *iterables: Iterable) -> List[Any]:
+        """
+        Apply a per-column function, in threads for wide frames.
+        
+        The pandas and numpy work done per column releases the GIL, so wide
+        frames are profiled on up to ``profiling.n_jobs`` threads (-1 uses all
+        cores). Frames narrower than PARALLEL_MIN_COLUMNS run serially, where
+        pool setup would cost more than it saves.
+        """
+        column_count = min(len(items) for items in iterables)
+        n_jobs = self.config.get('profiling', {}).get('n_jobs', -1)
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+        workers = min(n_jobs, column_count)
+        
+        if workers <= 1 or column_count < PARALLEL_MIN_COLUMNS:
+            return list(map(func, *iterables))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, *iterables))
+    
+    def _numeric_stats(self, col_data: pd.Series) -> Dict[str, Any]:
+        """
+        Compute numeric column statistics from a single float64 array.
+        
+        The column is converted once and all statistics are taken from the
+        same non-null values, instead of one pandas reduction (and null
+        check) per statistic. With numba installed, count, zeros, min, max,
+        mean and std come from one compiled kernel; only the median needs a
+        separate (sorting) pass.
+        """
+        values = col_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        if _numeric_moments is not None:
+            count, zeros, min_value, max_value, mean, m2 = _numeric_moments(values)
+            if count < len(values):
+                values = values[~np.isnan(values)]
+        else:
+            values = values[~np.isnan(values)]
+            count = len(values)
+            if count:
+                mean = values.mean()
+                m2 = ((values - mean) ** 2).sum()
+                min_value, max_value = values.min(), values.max()
+                zeros = np.count_nonzero(values == 0)
+        
+        if count == 0:
+            return {'min': None, 'max': None, 'mean': None, 'median': None,
+                    'std': None, 'zeros_count': 0}
+        
+        std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+        
+        return {
+            'min': float(min_value),
+            'max': float(max_value),
+            'mean': float(mean),
+            'median': float(np.median(values)),
+            'std': float(std),
+            'zeros_count': int(zeros),
+        }
     
     def _assess_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Assess overall data quality."""
-        total_cells = df.shape[0] * df.shape[1]
-        null_cells = df.isnull().sum().sum()
+        null_per_col = self._null_per_col
+        total_cells = self._n * df.shape[1]
+        null_cells = null_per_col.sum()
         
         quality_metrics = {
-            'overall_completeness': float((total_cells - null_cells) / total_cells * 100),
-            'columns_with_nulls': int((df.isnull().sum() > 0).sum()),
+            'overall_completeness': _percentage(total_cells - null_cells, total_cells),
+            'columns_with_nulls': int((null_per_col > 0).sum()),
             'total_null_cells': int(null_cells),
-            'duplicate_rows_count': int(df.duplicated().sum()),
-            'duplicate_rows_percentage': float(df.duplicated().sum() / len(df) * 100),
+            'duplicate_rows_count': self._duplicate_count,
+            'duplicate_rows_percentage': _percentage(self._duplicate_count, self._n),
         }
         
-        # Column-level quality issues
+        # Column-level quality issues. Settings, the row count and the
+        # per-column null counts (as plain ints, matched by position) are
+        # looked up once rather than per column
         quality_issues = []
+        add_issue = quality_issues.append
         threshold = self.config.get('profiling', {}).get('quality_thresholds', {})
         max_null_pct = threshold.get('max_null_percentage', 10)
+        row_count = self._n
         
-        for col in df.columns:
-            null_pct = df[col].isnull().sum() / len(df) * 100
+        for (col, col_data), dtype, null_count in zip(df.items(), self._dtypes, null_per_col.tolist()):
+            null_pct = _percentage(null_count, row_count)
             
             if null_pct > max_null_pct:
-                quality_issues.append({
+                add_issue({
                     'column': col,
                     'issue': 'high_null_percentage',
                     'value': f"{null_pct:.2f}%",
@@ -146,65 +598,65 @@ class DataProfiler:
                 })
             
             # Check for potential data type issues
-            if pd.api.types.is_object_dtype(df[col]):
-                # Check if column might be numeric but stored as string
-                try:
-                    pd.to_numeric(df[col].dropna(), errors='raise')
-                    quality_issues.append({
-                        'column': col,
-                        'issue': 'numeric_stored_as_string',
-                        'severity': 'low'
-                    })
-                except (ValueError, TypeError):
-                    pass
+            if dtype == object and self._is_numeric_string(col_data, null_count):
+                # Column might be numeric but stored as string
+                add_issue({
+                    'column': col,
+                    'issue': 'numeric_stored_as_string',
+                    'severity': 'low'
+                })
         
         quality_metrics['quality_issues'] = quality_issues
         
         return quality_metrics
     
+    def _is_numeric_string(self, col_data: pd.Series, null_count: int) -> bool:
+        """
+        Check whether every non-null value of an object column parses as a number.
+        
+        The first values are parsed on their own first: one unparseable value
+        already rules the column out, so text columns are rejected after a
+        small sample instead of a full parse. Columns that pass are confirmed
+        on the rest of their first NUMERIC_STRING_MAX_ROWS values; values past
+        that are not checked.
+        """
+        values = col_data if null_count == 0 else col_data.dropna()
+        
+        try:
+            pd.to_numeric(values.iloc[:NUMERIC_STRING_SAMPLE_SIZE], errors='raise')
+            if len(values) > NUMERIC_STRING_SAMPLE_SIZE:
+                pd.to_numeric(values.iloc[NUMERIC_STRING_SAMPLE_SIZE:NUMERIC_STRING_MAX_ROWS], errors='raise')
+        except (ValueError, TypeError):
+            return False
+        
+        return True
+    
     def _detect_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Detect common patterns in the data."""
-        patterns = {}
-        
-        for col in df.columns:
-            if pd.api.types.is_object_dtype(df[col]):
-                col_patterns = self._detect_column_patterns(df[col])
-                if col_patterns:
-                    patterns[col] = col_patterns
+        object_cols = [col for col, dtype in df.dtypes.items() if dtype == object]
+        col_patterns = self._map_columns(
+            self._detect_column_patterns, [df[col] for col in object_cols]
+        )
         
-        return patterns
+        return {
+            col: patterns
+            for col, patterns in zip(object_cols, col_patterns)
+            if patterns
+        }
     
     def _detect_column_patterns(self, series: pd.Series) -> Dict[str, Any]:
         """Detect patterns in a single column."""
-        import re
-        
-        sample = series.dropna().astype(str).head(100)
+        # Plain string list: compiled pattern.match on each value avoids the
+        # per-call Series overhead of .str.match for a 100-value sample
+        sample = series.dropna().head(100).astype(str).tolist()
         
         patterns_detected = {}
         
-        # Email pattern
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if sample.str.match(email_pattern).any():
-            matches = sample.str.match(email_pattern).sum()
-            patterns_detected['email'] = f"{matches}/{len(sample)} matches"
-        
-        # Phone pattern
-        phone_pattern = r'^\+?1?\d{9,15}$'
-        if sample.str.match(phone_pattern).any():
-            matches = sample.str.match(phone_pattern).sum()
-            patterns_detected['phone'] = f"{matches}/{len(sample)} matches"
-        
-        # ID patterns (e.g., CUST1001, ORD001)
-        id_pattern = r'^[A-Z]{3,4}\d{3,4}$'
-        if sample.str.match(id_pattern).any():
-            matches = sample.str.match(id_pattern).sum()
-            patterns_detected['id_code'] = f"{matches}/{len(sample)} matches"
-        
-        # URL pattern
-        url_pattern = r'^https?://[^\s]+$'
-        if sample.str.match(url_pattern).any():
-            matches = sample.str.match(url_pattern).sum()
-            patterns_detected['url'] = f"{matches}/{len(sample)} matches"
+        for name, pattern in COLUMN_PATTERNS.items():
+            match = pattern.match
+            matches = sum(1 for value in sample if match(value))
+            if matches:
+                patterns_detected[name] = f"{matches}/{len(sample)} matches"
         
         return patterns_detected
     
@@ -215,25 +667,47 @@ class DataProfiler:
         if len(numeric_cols) < 2:
             return {'message': 'Insufficient numeric columns for correlation analysis'}
         
-        corr_matrix = df[numeric_cols].corr()
+        corr = self._correlation_array(df[numeric_cols])
         
-        # Find strong correlations (|r| > 0.7)
-        strong_correlations = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                corr_value = corr_matrix.iloc[i, j]
-                if abs(corr_value) > 0.7:
-                    strong_correlations.append({
-                        'column_1': corr_matrix.columns[i],
-                        'column_2': corr_matrix.columns[j],
-                        'correlation': float(corr_value)
-                    })
+        # Find strong correlations (|r| > 0.7) in the upper triangle
+        with np.errstate(invalid='ignore'):
+            rows, cols = np.nonzero(np.triu(np.abs(corr) > 0.7, k=1))
+        strong_correlations = [
+            {
+                'column_1': numeric_cols[i],
+                'column_2': numeric_cols[j],
+                'correlation': float(corr[i, j])
+            }
+            for i, j in zip(rows.tolist(), cols.tolist())
+        ]
         
         return {
-            'correlation_matrix': corr_matrix.to_dict(),
+            'correlation_matrix': CorrelationMatrix(numeric_cols, corr),
             'strong_correlations': strong_correlations
         }
     
+    def _correlation_array(self, numeric_df: pd.DataFrame) -> np.ndarray:
+        """
+        Compute the Pearson correlation matrix of numeric columns as an array.
+        
+        Complete columns go through a single np.corrcoef call on one float64
+        matrix. Columns with nulls need pairwise-complete observations, which
+        only DataFrame.corr() provides, so those frames fall back to it.
+        """
+        values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        if np.isnan(values).any():
+            return numeric_df.corr().to_numpy()
+        
+        # Constant columns have no defined correlation and yield NaN, as in pandas
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.atleast_2d(np.corrcoef(values, rowvar=False))
+        
+        # corrcoef's diagonal can be off by rounding; pandas reports exactly 1.0
+        diagonal = np.diagonal(corr)
+        np.fill_diagonal(corr, np.where(np.isnan(diagonal), np.nan, 1.0))
+        return corr
+    
     def generate_ydata_profile(self, df: pd.DataFrame, output_path: Path, 
                                 dataset_name: str) -> None:
         """
@@ -246,7 +720,7 @@ class DataProfiler:
         """
         try:
             from ydata_profiling import ProfileReport
-            print(f"Generating ydata profile report for {dataset_name}...")
+            logger.info("Generating ydata profile report for %s...", dataset_name)
             
             profile = ProfileReport(
                 df,
@@ -257,44 +731,86 @@ class DataProfiler:
             
             output_file = output_path / f"{dataset_name}_profile_report.html"
             profile.to_file(output_file)
-            print(f"Profile report saved to: {output_file}")
+            logger.info("Profile report saved to: %s", output_file)
         except ImportError:
-            print(f"ydata-profiling not installed. Skipping HTML report generation.")
-            print(f"To install: pip install ydata-profiling --break-system-packages")
+            logger.warning("ydata-profiling not installed. Skipping HTML report generation.")
+            logger.warning("To install: pip install ydata-profiling --break-system-packages")
     
-    def save_profile(self, dataset_name: str, output_path: Path) -> None:
+    def save_profile(self, dataset_name: str, output_path: Path,
+                     compress: bool = False, keep_in_memory: bool = True) -> None:
         """
         Save profile results to JSON file.
         
+        The profile is written one top-level section at a time, so only the
+        encoding of the largest section is held in memory, never the whole
+        document. The correlation matrix goes to a compressed
+        ``{dataset_name}_corr.npz`` sidecar (arrays ``names`` and ``matrix``,
+        read with ``np.load``); the JSON records its file name and shape.
+        
         Args:
             dataset_name: Name of the dataset
             output_path: Directory to save the profile
+            compress: Write a gzip-compressed ``.json.gz`` file instead
+            keep_in_memory: Keep the profile in ``profile_results`` after
+                saving; pass False when only the file is needed
         """
         if dataset_name not in self.profile_results:
             raise ValueError(f"No profile found for dataset: {dataset_name}")
         
-        output_file = output_path / f"{dataset_name}_profile.json"
-        
-        # Custom JSON encoder for numpy types
-        def convert_numpy(obj):
-            if isinstance(obj, (np.integer, np.int64)):
-                return int(obj)
-            elif isinstance(obj, (np.floating, np.float64)):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return obj
-        
-        # Convert numpy types in the profile
-        import json
-        profile_json = json.loads(
-            json.dumps(self.profile_results[dataset_name], default=convert_numpy)
-        )
+        suffix = '.json.gz' if compress else '.json'
+        output_file = output_path / f"{dataset_name}_profile{suffix}"
+        profile = self.profile_results[dataset_name]
         
-        with open(output_file, 'w') as f:
-            json.dump(profile_json, f, indent=2)
+        # The matrix is written as a float array rather than k*k JSON entries
+        correlations = profile.get('correlations', {})
+        matrix = correlations.get('correlation_matrix')
+        if isinstance(matrix, CorrelationMatrix):
+            corr_file = output_path / f"{dataset_name}_corr.npz"
+            np.savez_compressed(
+                corr_file,
+                names=np.array([str(col) for col in matrix.columns]),
+                matrix=matrix.values,
+            )
+            profile = {**profile, 'correlations': {
+                'columns': matrix.columns,
+                'correlation_matrix_path': corr_file.name,
+                'shape': list(matrix.values.shape),
+                'strong_correlations': correlations['strong_correlations'],
+            }}
+        
+        opener = gzip.open if compress else open
+        with opener(output_file, 'wb') as f:
+            self._write_profile_json(profile, f)
+        
+        if not keep_in_memory:
+            del self.profile_results[dataset_name]
         
-        print(f"Profile saved to: {output_file}")
+        logger.info("Profile saved to: %s", output_file)
+    
+    def _write_profile_json(self, profile: Dict[str, Any], f: BinaryIO) -> None:
+        """Write a profile as indented JSON to a binary file, section by section."""
+        # Both encoders write numpy scalars and arrays directly, and NaN and
+        # infinite values as null (orjson does so itself), so the file is
+        # valid JSON either way
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            
+            def encode(obj: Any) -> bytes:
+                return orjson.dumps(obj, option=option)
+        else:
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False, allow_nan=False,
+                                       default=_json_default)
+            
+            def encode(obj: Any) -> bytes:
+                return encoder.encode(_finite_floats(obj)).encode('utf-8')
+        
+        f.write(b'{')
+        for i, (key, section) in enumerate(profile.items()):
+            # Sections are encoded at the top level; indenting their
+            # continuation lines nests them as in a whole-document encode
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(encode(key) + b': ' + encode(section).replace(b'\n', b'\n  '))
+        f.write(b'\n}\n' if profile else b'}\n')
     
     def get_summary(self, dataset_name: str) -> str:
         """Generate a text summary of the profile."""
@@ -304,6 +820,8 @@ class DataProfiler:
         profile = self.profile_results[dataset_name]
         basic = profile['basic_info']
         quality = profile['data_quality']
+        duplicate_rows = basic['duplicate_rows']
+        duplicates = f"{duplicate_rows:,}" if duplicate_rows is not None else 'not counted'
         
         summary = f"""
 Data Profile Summary: {dataset_name}
@@ -312,7 +830,7 @@ Dataset Information:
   - Rows: {basic['row_count']:,}
   - Columns: {basic['column_count']}
   - Memory Usage: {basic['memory_usage_mb']:.2f} MB
-  - Duplicate Rows: {basic['duplicate_rows']:,}
+  - Duplicate Rows: {duplicates}
 
 Data Quality:
   - Overall Completeness: {quality['overall_completeness']:.2f}%
@@ -325,10 +843,310 @@ Data Quality:
         return summary
 
 
+class StreamingProfiler:
+    """
+    Accumulates column statistics across DataFrame chunks in bounded memory.
+    
+    Counts, min/max, mean and standard deviation are exact (the latter two
+    are merged per chunk with Chan's parallel variance update). Medians come
+    from a bounded uniform sample of each numeric column. Distinct values are
+    counted from the STREAMING_DISTINCT_SKETCH_SIZE smallest value hashes of
+    each column, exactly up to that many and estimated beyond it (the profile
+    then sets 'unique_count_estimated'). Top values keep the counts of at most
+    STREAMING_TOP_VALUES_CAPACITY values per string column, dropping the
+    rarest when full.
+    
+    Counting duplicate rows needs a hash of every distinct row, so it is
+    opt-in through ``count_duplicates`` or ``profiling.streaming_duplicates``;
+    otherwise the duplicate counts are reported as None.
+    """
+    
+    def __init__(self, config: Dict[str, Any], median_sample_size: int = 100_000,
+                 count_duplicates: Optional[bool] = None):
+        """
+        Initialize the StreamingProfiler.
+        
+        Args:
+            config: Configuration dictionary with profiling settings
+            median_sample_size: Values kept per numeric column to estimate the median
+            count_duplicates: Whether to count duplicate rows; defaults to
+                ``profiling.streaming_duplicates``
+        """
+        if count_duplicates is None:
+            count_duplicates = config.get('profiling', {}).get('streaming_duplicates', False)
+        
+        self.config = config
+        self.median_sample_size = median_sample_size
+        self.count_duplicates = count_duplicates
+        self.row_count = 0
+        self.memory_bytes = 0
+        self.columns = []
+        self.dtypes = {}
+        self._row_hashes = np.empty(0, dtype=np.uint64)
+        self._duplicate_rows = 0
+        self._columns = {}
+        self._rng = np.random.default_rng(0)
+    
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk into the running statistics."""
+        if not self.columns:
+            self.columns = list(chunk.columns)
+        
+        self.row_count += len(chunk)
+        self.memory_bytes += int(chunk.memory_usage(deep=True).sum())
+        
+        if self.count_duplicates:
+            self._update_duplicates(chunk)
+        
+        for col in chunk.columns:
+            self._update_column(col, chunk[col])
+    
+    def _update_duplicates(self, chunk: pd.DataFrame) -> None:
+        """
+        Count the chunk's rows whose hash was already seen.
+        
+        Seen hashes are kept as a sorted uint64 array, so a chunk is checked
+        with one sort and a binary search. Numeric columns are hashed as
+        float64, the dtype an integer column is promoted to once a later
+        chunk holds nulls, so a row hashes the same in every chunk.
+        """
+        numeric = {col: np.float64 for col, dtype in chunk.dtypes.items()
+                   if dtype.kind in 'iuf' and dtype != np.float64}
+        if numeric:
+            chunk = chunk.astype(numeric)
+        
+        row_hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        row_hashes.sort()
+        
+        # First occurrence within the chunk and not seen in an earlier one
+        is_new = np.ones(len(row_hashes), dtype=bool)
+        is_new[1:] = row_hashes[1:] != row_hashes[:-1]
+        seen = self._row_hashes
+        if len(seen) and len(row_hashes):
+            positions = np.minimum(np.searchsorted(seen, row_hashes), len(seen) - 1)
+            is_new &= seen[positions] != row_hashes
+        
+        self._duplicate_rows += int(len(row_hashes) - np.count_nonzero(is_new))
+        # Both halves are sorted, which the stable sort merges in linear time
+        self._row_hashes = np.sort(np.concatenate([seen, row_hashes[is_new]]), kind='stable')
+    
+    def _update_column(self, col: str, col_data: pd.Series) -> None:
+        """Fold one chunk of a column into its running statistics."""
+        state = self._columns.setdefault(col, {
+            'null_count': 0,
+            'hashes': np.empty(0, dtype=np.uint64),
+            'hashes_truncated': False,
+            'values': Counter(),
+            'sample_values': [],
+            'numeric_as_string': True,
+        })
+        
+        # Integer columns become float once a later chunk contains nulls
+        dtype = col_data.dtype
+        if col in self.dtypes and self.dtypes[col] != dtype:
+            try:
+                dtype = np.result_type(self.dtypes[col], dtype)
+            except TypeError:
+                dtype = np.dtype(object)
+        self.dtypes[col] = dtype
+        
+        non_null = col_data.dropna()
+        state['null_count'] += len(col_data) - len(non_null)
+        
+        if len(state['sample_values']) < 5:
+            needed = 5 - len(state['sample_values'])
+            state['sample_values'].extend(str(v) for v in non_null.head(needed).tolist())
+        
+        if pd.api.types.is_numeric_dtype(col_data):
+            # Adding 0.0 folds -0.0 into 0.0 so both hash alike
+            values = non_null.to_numpy(dtype=np.float64)
+            self._update_distinct(state, pd.util.hash_array(values + 0.0))
+            if len(values):
+                self._update_numeric(state, values)
+            return
+        
+        self._update_distinct(state, pd.util.hash_pandas_object(non_null, index=False).to_numpy())
+        
+        if pd.api.types.is_object_dtype(col_data):
+            self._update_top_values(state, non_null)
+            if state['numeric_as_string']:
+                try:
+                    pd.to_numeric(non_null, errors='raise')
+                except (ValueError, TypeError):
+                    state['numeric_as_string'] = False
+    
+    def _update_distinct(self, state: Dict[str, Any], value_hashes: np.ndarray) -> None:
+        """Merge a chunk's value hashes into the column's k-minimum-values sketch."""
+        hashes = np.union1d(state['hashes'], value_hashes)
+        if len(hashes) > STREAMING_DISTINCT_SKETCH_SIZE:
+            hashes = hashes[:STREAMING_DISTINCT_SKETCH_SIZE]
+            state['hashes_truncated'] = True
+        state['hashes'] = hashes
+    
+    def _update_top_values(self, state: Dict[str, Any], non_null: pd.Series) -> None:
+        """Add a chunk's value counts, keeping the most common when over capacity."""
+        values = state['values']
+        values.update(non_null.value_counts(sort=False).to_dict())
+        if len(values) > STREAMING_TOP_VALUES_CAPACITY:
+            state['values'] = Counter(dict(values.most_common(STREAMING_TOP_VALUES_CAPACITY // 2)))
+    
+    def _update_numeric(self, state: Dict[str, Any], values: np.ndarray) -> None:
+        """Merge a chunk of non-null numeric values into running moments."""
+        n_b = len(values)
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        
+        if 'count' not in state:
+            state.update({
+                'count': n_b, 'mean': mean_b, 'm2': m2_b,
+                'min': float(values.min()), 'max': float(values.max()),
+                'zeros_count': 0,
+                'sample_keys': np.empty(0), 'sample': np.empty(0),
+            })
+        else:
+            n_a = state['count']
+            n = n_a + n_b
+            delta = mean_b - state['mean']
+            state['mean'] += delta * n_b / n
+            state['m2'] += m2_b + delta ** 2 * n_a * n_b / n
+            state['count'] = n
+            state['min'] = min(state['min'], float(values.min()))
+            state['max'] = max(state['max'], float(values.max()))
+        
+        state['zeros_count'] += int((values == 0).sum())
+        
+        # Keeping the values with the smallest random keys yields a uniform
+        # sample of everything seen so far
+        keys = np.concatenate([state['sample_keys'], self._rng.random(n_b)])
+        sample = np.concatenate([state['sample'], values])
+        if len(keys) > self.median_sample_size:
+            keep = np.argpartition(keys, self.median_sample_size)[:self.median_sample_size]
+            keys, sample = keys[keep], sample[keep]
+        state['sample_keys'], state['sample'] = keys, sample
+    
+    def get_basic_info(self) -> Dict[str, Any]:
+        """Return basic dataset information in DataProfiler's format."""
+        return {
+            'row_count': self.row_count,
+            'column_count': len(self.columns),
+            'memory_usage_mb': self.memory_bytes / (1024 * 1024),
+            'duplicate_rows': self._duplicate_rows if self.count_duplicates else None,
+            'columns': list(self.columns),
+            'dtypes': {col: str(self.dtypes[col]) for col in self.columns},
+        }
+    
+    def get_column_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-column profiles in DataProfiler's format."""
+        column_profiles = {}
+        
+        for col in self.columns:
+            state = self._columns[col]
+            dtype = self.dtypes[col]
+            unique_count = self._distinct_count(state)
+            
+            profile = {
+                'data_type': str(dtype),
+                'null_count': int(state['null_count']),
+                'null_percentage': _percentage(state['null_count'], self.row_count),
+                'unique_count': unique_count,
+                'unique_percentage': _percentage(unique_count, self.row_count),
+            }
+            if state['hashes_truncated']:
+                profile['unique_count_estimated'] = True
+            
+            if pd.api.types.is_numeric_dtype(dtype):
+                has_values = 'count' in state
+                std = None
+                if has_values and state['count'] > 1:
+                    std = float(np.sqrt(state['m2'] / (state['count'] - 1)))
+                profile.update({
+                    'min': state['min'] if has_values else None,
+                    'max': state['max'] if has_values else None,
+                    'mean': state['mean'] if has_values else None,
+                    'median': float(np.median(state['sample'])) if has_values else None,
+                    'std': std,
+                    'zeros_count': state.get('zeros_count', 0),
+                })
+            
+            if pd.api.types.is_object_dtype(dtype):
+                profile.update({
+                    'top_values': dict(state['values'].most_common(10)),
+                    'is_categorical': unique_count < 50,
+                })
+            
+            profile['sample_values'] = state['sample_values']
+            
+            column_profiles[col] = profile
+        
+        return column_profiles
+    
+    def _distinct_count(self, state: Dict[str, Any]) -> int:
+        """
+        Count a column's distinct values from its sketch.
+        
+        Until the sketch fills, it holds every distinct hash. After that the
+        k-th smallest of k uniform 64-bit hashes estimates the distinct count
+        as (k - 1) / (hash / 2**64).
+        """
+        hashes = state['hashes']
+        if not state['hashes_truncated']:
+            return len(hashes)
+        return int(round((len(hashes) - 1) / (float(hashes[-1]) / 2.0 ** 64)))
+    
+    def get_quality(self) -> Dict[str, Any]:
+        """Return data quality metrics in DataProfiler's format."""
+        total_cells = self.row_count * len(self.columns)
+        null_cells = sum(self._columns[col]['null_count'] for col in self.columns)
+        
+        quality_metrics = {
+            'overall_completeness': _percentage(total_cells - null_cells, total_cells),
+            'columns_with_nulls': sum(1 for col in self.columns if self._columns[col]['null_count'] > 0),
+            'total_null_cells': int(null_cells),
+            'duplicate_rows_count': None,
+            'duplicate_rows_percentage': None,
+        }
+        if self.count_duplicates:
+            quality_metrics['duplicate_rows_count'] = self._duplicate_rows
+            quality_metrics['duplicate_rows_percentage'] = _percentage(self._duplicate_rows, self.row_count)
+        
+        quality_issues = []
+        threshold = self.config.get('profiling', {}).get('quality_thresholds', {})
+        max_null_pct = threshold.get('max_null_percentage', 10)
+        
+        for col in self.columns:
+            state = self._columns[col]
+            null_pct = _percentage(state['null_count'], self.row_count)
+            
+            if null_pct > max_null_pct:
+                quality_issues.append({
+                    'column': col,
+                    'issue': 'high_null_percentage',
+                    'value': f"{null_pct:.2f}%",
+                    'severity': 'high' if null_pct > 50 else 'medium'
+                })
+            
+            if pd.api.types.is_object_dtype(self.dtypes[col]) and state['numeric_as_string']:
+                quality_issues.append({
+                    'column': col,
+                    'issue': 'numeric_stored_as_string',
+                    'severity': 'low'
+                })
+        
+        quality_metrics['quality_issues'] = quality_issues
+        
+        return quality_metrics
+
+
 def profile_csv_file(file_path: str, config: Dict[str, Any]) -> DataProfiler:
     """
     Convenience function to profile a CSV file.
     
+    When ``profiling.chunk_size`` is set, the file is read and profiled that
+    many rows at a time with ``DataProfiler.profile_chunks``, so it never has
+    to fit in memory as a whole. Column types are merged across chunks, so an
+    integer column with nulls only in a later chunk is reported as float64
+    just as when the file is read whole.
+    
     Args:
         file_path: Path to CSV file
         config: Configuration dictionary
@@ -336,10 +1154,16 @@ def profile_csv_file(file_path: str, config: Dict[str, Any]) -> DataProfiler:
     Returns:
         DataProfiler instance with results
     """
-    df = pd.read_csv(file_path)
     dataset_name = Path(file_path).stem
+    chunk_size = config.get('profiling', {}).get('chunk_size')
     
     profiler = DataProfiler(config)
-    profiler.profile_dataset(df, dataset_name)
+    
+    if chunk_size:
+        with pd.read_csv(file_path, chunksize=chunk_size) as reader:
+            profiler.profile_chunks(reader, dataset_name)
+    else:
+        df = pd.read_csv(file_path)
+        profiler.profile_dataset(df, dataset_name)
     
     return profiler
@@ -0,0 +1,112 @@
+"""DataProfiler.profile_dataset and its per-column checks."""
+
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import profiler.data_profiler as data_profiler
+from profiler.data_profiler import DataProfiler
+
+
+def make_frame(rows=1000):
+    rng = np.random.default_rng(1)
+    amount = rng.normal(100, 15, rows)
+    amount[::4] = np.nan
+    return pd.DataFrame({
+        'amount': amount,
+        'segment': rng.choice(['a', 'b', 'c'], rows),
+    })
+
+
+def test_sampled_null_counts_cover_every_row():
+    df = make_frame()
+    config = {'profiling': {'sample_size': 100, 'correlation_analysis': False}}
+    profile = DataProfiler(config).profile_dataset(df, 'frame')
+    
+    assert profile['sampled'] is True
+    amount = profile['column_profiles']['amount']
+    assert amount['null_count'] == 250
+    assert amount['null_percentage'] == 25.0
+    assert amount['unique_count_estimated'] is True
+    assert amount['unique_count'] <= 100
+
+
+def test_full_profile_is_not_marked_estimated():
+    profile = DataProfiler({'profiling': {}}).profile_dataset(make_frame(), 'frame')
+    
+    assert 'sampled' not in profile
+    for col_profile in profile['column_profiles'].values():
+        assert 'unique_count_estimated' not in col_profile
+
+
+def test_empty_frame():
+    df = pd.DataFrame({'amount': pd.Series(dtype=float), 'segment': pd.Series(dtype=object)})
+    profile = DataProfiler({'profiling': {}}).profile_dataset(df, 'empty')
+    
+    assert profile['data_quality']['duplicate_rows_percentage'] == 0.0
+    assert profile['column_profiles']['amount']['null_percentage'] == 0.0
+
+
+def test_correlation_matrix_in_memory_and_sidecar(tmp_path):
+    df = pd.DataFrame({'x': [1.0, 2.0, 3.0, 4.0], 'y': [2.0, 4.0, 6.0, 8.5], 'z': [4.0, 1.0, 3.0, 2.0]})
+    profiler = DataProfiler({'profiling': {}})
+    profile = profiler.profile_dataset(df, 'frame')
+    
+    matrix = profile['correlations']['correlation_matrix']
+    assert list(matrix) == ['x', 'y', 'z']
+    assert matrix['y']['y'] == 1.0
+    assert matrix['x']['z'] == pytest.approx(df['x'].corr(df['z']))
+    pd.testing.assert_frame_equal(pd.DataFrame(matrix.to_dict()), df.corr())
+    
+    profiler.save_profile('frame', tmp_path)
+    with np.load(tmp_path / 'frame_corr.npz') as sidecar:
+        assert sidecar['names'].tolist() == ['x', 'y', 'z']
+        np.testing.assert_allclose(sidecar['matrix'], df.corr().to_numpy())
+    assert profile['correlations']['correlation_matrix'] is matrix
+
+
+def test_numeric_string_check_covers_the_whole_prefix(monkeypatch):
+    monkeypatch.setattr(data_profiler, 'NUMERIC_STRING_SAMPLE_SIZE', 10)
+    monkeypatch.setattr(data_profiler, 'NUMERIC_STRING_MAX_ROWS', 100)
+    profiler = DataProfiler({'profiling': {}})
+    
+    numbers = pd.Series([str(i) for i in range(200)], dtype=object)
+    assert profiler._is_numeric_string(numbers, 0)
+    # Past the sample but within the cap
+    assert not profiler._is_numeric_string(numbers.where(numbers.index != 50, 'n/a'), 0)
+    # Past the cap
+    assert profiler._is_numeric_string(numbers.where(numbers.index != 150, 'n/a'), 0)
+
+
+def test_duplicate_detection_defaults_to_exact():
+    df = pd.DataFrame({'value': [1, '1', 2, 2]}, dtype=object)
+    
+    exact = DataProfiler({'profiling': {}}).profile_dataset(df, 'frame')
+    hashed = DataProfiler({'profiling': {'duplicate_detection': 'hash'}}).profile_dataset(df, 'frame')
+    assert exact['basic_info']['duplicate_rows'] == 1
+    assert hashed['basic_info']['duplicate_rows'] == 2
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_profile_json_writes_non_finite_as_null(monkeypatch, use_orjson):
+    if use_orjson and data_profiler.orjson is None:
+        pytest.skip('orjson is not installed')
+    if not use_orjson:
+        monkeypatch.setattr(data_profiler, 'orjson', None)
+    
+    profile = {
+        'stats': {'mean': float('nan'), 'max': np.float64('inf'), 'min': np.float32('-inf')},
+        'values': [1.5, float('nan')],
+        'matrix': np.array([[1.0, np.nan]]),
+    }
+    buffer = io.BytesIO()
+    DataProfiler({'profiling': {}})._write_profile_json(profile, buffer)
+    
+    assert json.loads(buffer.getvalue()) == {
+        'stats': {'mean': None, 'max': None, 'min': None},
+        'values': [1.5, None],
+        'matrix': [[1.0, None]],
+    }
@@ -0,0 +1,33 @@
+"""MetadataExtractor SQL type inference."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from metadata.extractor import MetadataExtractor
+
+
+@pytest.mark.parametrize('values, expected', [
+    ([0, 32767], 'SMALLINT'),
+    ([-70000, -5], 'SMALLINT'),
+    ([0, 32768], 'INTEGER'),
+    ([0, 2147483647], 'INTEGER'),
+    ([0, 2147483648], 'BIGINT'),
+    (np.array([0, 2**63 - 1]), 'BIGINT'),
+    (np.array([0, 2**64 - 1], dtype=np.uint64), 'BIGINT'),
+    (np.array([1, 2], dtype=np.int8), 'SMALLINT'),
+    (np.array([], dtype=np.int64), 'BIGINT'),
+    ([0.5, 1.5], 'DECIMAL(18,2)'),
+    (pd.array([1, None], dtype='Int64'), 'NUMERIC'),
+])
+def test_infer_sql_types_matches_per_column_inference(values, expected):
+    extractor = MetadataExtractor({})
+    df = pd.DataFrame({'value': values})
+    
+    assert extractor._infer_sql_type(df['value']) == expected
+    assert extractor._infer_sql_types(df) == {'value': expected}
+
+
+def test_infer_sql_types_skips_non_numeric_columns():
+    df = pd.DataFrame({'count': [1, 40000], 'name': ['a', 'b'], 'when': pd.to_datetime(['2024-01-01'] * 2)})
+    assert MetadataExtractor({})._infer_sql_types(df) == {'count': 'INTEGER'}
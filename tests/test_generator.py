@@ -0,0 +1,34 @@
+"""DictionaryGenerator column definitions."""
+
+from dictionary.generator import DictionaryGenerator, _format_stats
+
+
+def test_format_stats_returns_a_new_dict():
+    first = _format_stats((1, 10.0, 5, 50.0), (0, 9, 4.5, 4))
+    first['null_count'] = 99
+    
+    second = _format_stats((1, 10.0, 5, 50.0), (0, 9, 4.5, 4))
+    assert second is not first
+    assert second['null_count'] == 1
+    assert second['median'] == 4
+
+
+def test_sample_values_stay_a_list():
+    generator = DictionaryGenerator({'dictionary': {'include_samples': True}})
+    profile = {
+        'basic_info': {'row_count': 2, 'column_count': 1},
+        'column_profiles': {'region': {'null_count': 0, 'sample_values': ['North', 'South']}},
+    }
+    metadata = {'schema': [{'column_name': 'region', 'position': 0}]}
+    
+    dictionary = generator.generate_dictionary('sales', profile, metadata, {'terms': {}})
+    assert dictionary['columns'][0]['sample_values'] == ['North', 'South']
+    assert isinstance(dictionary['columns'][0]['sample_values'], list)
+
+
+def test_format_stats_keeps_value_types():
+    _format_stats((0, 0, 3, 100.0), (0, 9, 4, 4))
+    stats = _format_stats((0, 0.0, 3, 100.0), (0.0, 9.0, 4.0, 4.0))
+    
+    assert isinstance(stats['null_percentage'], float)
+    assert all(isinstance(stats[key], float) for key in ('min', 'max', 'mean', 'median'))
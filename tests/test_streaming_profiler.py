@@ -0,0 +1,126 @@
+"""StreamingProfiler must agree with DataProfiler.profile_dataset."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import profiler.data_profiler as data_profiler
+from profiler.data_profiler import DataProfiler, StreamingProfiler
+
+CONFIG = {'profiling': {'duplicate_detection': 'exact'}}
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4, 5, 2, 7, 8, 9, 10, 2, 12],
+        'amount': [10.5, 0.0, 3.25, np.nan, 7.0, 0.0, 1.5, np.nan, 2.0, 4.0, 0.0, 8.75],
+        'city': ['Pune', 'Delhi', 'Pune', None, 'Goa', 'Delhi', 'Pune', 'Goa', None, 'Pune', 'Delhi', 'Goa'],
+        'code': ['1', '2', '3', '4', '5', '2', '7', '8', '9', '10', '2', '12'],
+    })
+
+
+def split(df, size):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def streamed(chunks, **kwargs):
+    streaming = StreamingProfiler(CONFIG, **kwargs)
+    for chunk in chunks:
+        streaming.update(chunk)
+    return streaming
+
+
+def test_matches_profile_dataset(frame):
+    expected = DataProfiler(CONFIG).profile_dataset(frame, 'frame')
+    streaming = streamed(split(frame, 5), count_duplicates=True)
+    
+    basic = streaming.get_basic_info()
+    for key in ('row_count', 'column_count', 'duplicate_rows', 'columns', 'dtypes'):
+        assert basic[key] == expected['basic_info'][key]
+    
+    quality = streaming.get_quality()
+    assert quality == expected['data_quality']
+    
+    profiles = streaming.get_column_profiles()
+    for col, expected_profile in expected['column_profiles'].items():
+        profile = profiles[col]
+        assert profile.keys() == expected_profile.keys()
+        for key, value in expected_profile.items():
+            if isinstance(value, float):
+                assert profile[key] == pytest.approx(value), (col, key)
+            else:
+                assert profile[key] == value, (col, key)
+
+
+def test_duplicates_are_opt_in(frame):
+    streaming = streamed(split(frame, 5))
+    assert streaming.get_basic_info()['duplicate_rows'] is None
+    assert streaming.get_quality()['duplicate_rows_count'] is None
+    assert streaming._row_hashes.size == 0
+
+
+def test_duplicates_across_promoted_dtypes():
+    first = pd.DataFrame({'x': [1, 2], 'y': ['a', 'b']})
+    second = pd.DataFrame({'x': [1.0, np.nan], 'y': ['a', 'c']})
+    streaming = streamed([first, second], count_duplicates=True)
+    assert streaming.dtypes['x'] == np.float64
+    assert streaming.get_basic_info()['duplicate_rows'] == 1
+
+
+def test_empty_input():
+    streaming = streamed([])
+    assert streaming.get_basic_info()['row_count'] == 0
+    assert streaming.get_quality()['overall_completeness'] == 0.0
+    assert streaming.get_column_profiles() == {}
+
+
+def test_zero_row_chunks(frame):
+    streaming = streamed([frame.iloc[:0]], count_duplicates=True)
+    profiles = streaming.get_column_profiles()
+    assert profiles['amount']['null_percentage'] == 0.0
+    assert profiles['amount']['mean'] is None
+    assert streaming.get_quality()['duplicate_rows_percentage'] == 0.0
+
+
+def test_unique_count_estimate_is_flagged(monkeypatch):
+    monkeypatch.setattr(data_profiler, 'STREAMING_DISTINCT_SKETCH_SIZE', 256)
+    values = pd.DataFrame({'n': np.arange(20_000)})
+    profile = streamed(split(values, 3000)).get_column_profiles()['n']
+    assert profile['unique_count_estimated'] is True
+    assert profile['unique_count'] == pytest.approx(20_000, rel=0.2)
+
+
+def test_top_values_capacity(monkeypatch):
+    monkeypatch.setattr(data_profiler, 'STREAMING_TOP_VALUES_CAPACITY', 20)
+    values = pd.DataFrame({'s': ['common'] * 50 + [f'rare{i}' for i in range(100)]})
+    streaming = streamed(split(values, 30))
+    assert len(streaming._columns['s']['values']) <= 20
+    assert next(iter(streaming.get_column_profiles()['s']['top_values'])) == 'common'
+
+
+def test_profile_csv_file_in_chunks(frame, tmp_path):
+    frame = pd.concat([frame.assign(id=range(12)), frame.head(3).assign(id=[0, 1, np.nan])])
+    path = tmp_path / 'frame.csv'
+    frame.to_csv(path, index=False)
+    
+    config = {'profiling': {'duplicate_detection': 'exact', 'correlation_analysis': False}}
+    whole = data_profiler.profile_csv_file(str(path), config).profile_results['frame']
+    config['profiling'].update(chunk_size=4, streaming_duplicates=True)
+    chunked = data_profiler.profile_csv_file(str(path), config).profile_results['frame']
+    
+    assert chunked['basic_info']['dtypes'] == whole['basic_info']['dtypes']
+    assert chunked['basic_info']['duplicate_rows'] == whole['basic_info']['duplicate_rows'] == 2
+    assert chunked['data_quality'] == whole['data_quality']
+    for col in frame.columns:
+        assert chunked['column_profiles'][col]['unique_count'] == whole['column_profiles'][col]['unique_count']
+
+
+def test_profile_csv_file_header_only(tmp_path):
+    path = tmp_path / 'empty.csv'
+    path.write_text('a,b\n')
+    
+    config = {'profiling': {'chunk_size': 4}}
+    profile = data_profiler.profile_csv_file(str(path), config).profile_results['empty']
+    assert profile['basic_info']['row_count'] == 0
+    assert profile['data_quality']['overall_completeness'] == 0.0
@@ -0,0 +1,223 @@
+"""TermMapper column mappings and glossary loading."""
+
+import json
+from difflib import SequenceMatcher
+
+import pandas as pd
+import pytest
+
+import glossary.term_mapper as term_mapper
+from glossary.term_mapper import ColumnMapping, TermMapper, load_business_terms
+
+GLOSSARY = """
+terms:
+  customer_id:
+    business_name: "Customer Identifier"
+    definition: "Unique code assigned to each customer account"
+    owner: "Customer Success Team"
+  customer_email:
+    business_name: "Email Address"
+    definition: "Primary contact email"
+    owner: "Customer Success Team"
+    pii: true
+"""
+
+CONFIG = {'glossary': {'auto_mapping': True, 'similarity_threshold': 0.8}}
+
+
+@pytest.fixture(params=['rapidfuzz', 'difflib'])
+def scorer(request, monkeypatch):
+    if request.param == 'rapidfuzz' and term_mapper.process is None:
+        pytest.skip('rapidfuzz is not installed')
+    if request.param == 'difflib':
+        monkeypatch.setattr(term_mapper, 'process', None)
+    return request.param
+
+
+@pytest.fixture
+def glossary_path(tmp_path):
+    path = tmp_path / 'business_terms.yaml'
+    path.write_text(GLOSSARY)
+    return path
+
+
+def make_mapping(**overrides):
+    fields = dict(
+        technical_name='cust_email',
+        business_name='Email Address',
+        definition='Customer email',
+        match_type='fuzzy',
+        mapped=True,
+        owner='CRM',
+        is_pii=True,
+        fuzzy_match_score=0.9,
+        matched_term='customer_email',
+        term_info={'data_type': 'string', 'examples': ['a@b.com']},
+    )
+    fields.update(overrides)
+    return ColumnMapping(**fields)
+
+
+def test_column_mapping_to_dict():
+    entry = make_mapping().to_dict()
+    
+    assert entry['data_type'] == 'string'
+    assert entry['examples'] == ['a@b.com']
+    assert entry['format'] == ''
+    assert entry['fuzzy_match_score'] == 0.9
+    assert entry['matched_term'] == 'customer_email'
+
+
+def test_column_mapping_reads_like_a_dict():
+    mapping = make_mapping()
+    
+    assert mapping['business_name'] == 'Email Address'
+    assert mapping.get('is_pii') is True
+    assert dict(mapping) == mapping.to_dict()
+    assert 'owner' in mapping
+
+
+def test_unmapped_column_mapping_keys():
+    mapping = make_mapping(mapped=False, match_type='none', owner='', is_pii=False)
+    
+    assert set(mapping) == {'technical_name', 'business_name', 'definition', 'mapped', 'match_type'}
+    assert mapping.get('is_pii') is None
+    with pytest.raises(KeyError):
+        mapping['owner']
+
+
+def test_cached_mappings_are_not_shared(glossary_path):
+    mapper = TermMapper(str(glossary_path), CONFIG)
+    first = mapper.map_columns(['customer_id', 'region'], 'first')
+    second = mapper.map_columns(['customer_id', 'region'], 'second')
+    
+    assert second['customer_id'] == first['customer_id']
+    assert second['customer_id'] is not first['customer_id']
+    
+    first['customer_id'].owner = 'Edited'
+    assert second['customer_id'].owner == 'Customer Success Team'
+    assert mapper.map_columns(['customer_id', 'region'], 'third')['customer_id'].owner == 'Customer Success Team'
+
+
+def test_mappings_are_reused_across_runs(glossary_path, monkeypatch):
+    columns = ['customer_id', 'customer_emial', 'region']
+    first = TermMapper(str(glossary_path), CONFIG).map_columns(columns, 'sales')
+    assert glossary_path.with_suffix('.mappings.cache.json').exists()
+    
+    # A new mapper, as in the next pipeline run, skips fuzzy matching
+    mapper = TermMapper(str(glossary_path), CONFIG)
+    monkeypatch.setattr(mapper, '_find_fuzzy_matches', None)
+    second = mapper.map_columns(columns, 'sales')
+    
+    assert {col: m.to_dict() for col, m in second.items()} == {col: m.to_dict() for col, m in first.items()}
+    assert second['customer_emial'].term_info == first['customer_emial'].term_info
+
+
+def test_unreadable_mapping_cache_is_rebuilt(glossary_path):
+    TermMapper(str(glossary_path), CONFIG).map_columns(['customer_id'], 'sales')
+    cache_path = glossary_path.with_suffix('.mappings.cache.json')
+    key = next(iter(json.loads(cache_path.read_text())))
+    cache_path.write_text(json.dumps({key: {'customer_id': {'unknown': 1}}}))
+    
+    mappings = TermMapper(str(glossary_path), CONFIG).map_columns(['customer_id'], 'sales')
+    assert mappings['customer_id'].business_name == 'Customer Identifier'
+    assert json.loads(cache_path.read_text())[key]['customer_id']['mapped'] is True
+
+
+def test_fuzzy_scores_match_difflib(glossary_path, scorer):
+    mapper = TermMapper(str(glossary_path), CONFIG)
+    mappings = mapper.map_columns(['customer_emial', 'Customer_ID', 'customer_elami', 'region'], 'sales')
+    
+    email = mappings['customer_emial']
+    assert email.matched_term == 'customer_email'
+    assert email.fuzzy_match_score == SequenceMatcher(None, 'customer_emial', 'customer_email').ratio()
+    
+    assert mappings['Customer_ID'].matched_term == 'customer_id'
+    assert mappings['Customer_ID'].fuzzy_match_score == 1.0
+    
+    # rapidfuzz's own ratio prefers customer_email (0.857 against difflib's
+    # 0.786), but both paths score with difflib and pick customer_id
+    assert mappings['customer_elami'].matched_term == 'customer_id'
+    assert mappings['customer_elami'].fuzzy_match_score == pytest.approx(0.8)
+    assert not mappings['region'].mapped
+
+
+@pytest.mark.parametrize('use_arrow', [True, False])
+def test_csv_export_matches_pandas(glossary_path, tmp_path, monkeypatch, use_arrow):
+    if use_arrow and term_mapper.pa is None:
+        pytest.skip('pyarrow is not installed')
+    if not use_arrow:
+        monkeypatch.setattr(term_mapper, 'pa', None)
+    mapper = TermMapper(str(glossary_path), CONFIG)
+    mapper.map_columns(['customer_id', 'customer_email', 'region'], 'sales')
+    mapper.mappings['sales']['region'].definition = 'Sales region, e.g. "EMEA"'
+    
+    mapper.export_glossary('sales', tmp_path, format='csv')
+    
+    expected = pd.DataFrame([
+        {
+            'Technical Name': m['technical_name'],
+            'Business Name': m['business_name'],
+            'Definition': m['definition'],
+            'Data Type': m.get('data_type', ''),
+            'Owner': m.get('owner', ''),
+            'Is PII': m.get('is_pii', False),
+            'Mapped': m['mapped'],
+        }
+        for m in mapper.get_business_glossary('sales')['terms'].values()
+    ])
+    # Arrow quotes every field, so the files are compared as parsed text
+    saved = pd.read_csv(tmp_path / 'sales_glossary.csv', dtype=str, keep_default_na=False)
+    pd.testing.assert_frame_equal(saved, expected.astype(str))
+
+
+def test_glossary_cache_round_trip(glossary_path):
+    terms = load_business_terms(str(glossary_path))
+    cache_path = glossary_path.with_suffix('.cache.json')
+    
+    cached = json.loads(cache_path.read_text())
+    assert cached['data'] == terms
+    
+    # A cache with the current hash is used without parsing the YAML
+    cache_path.write_text(json.dumps({'hash': cached['hash'], 'data': {'terms': {}}}))
+    assert load_business_terms(str(glossary_path)) == {'terms': {}}
+
+
+@pytest.mark.parametrize('payload', [
+    'not json',
+    '["a list"]',
+    '{"hash": "stale", "data": {"terms": {}}}',
+    'matching hash without data',
+])
+def test_bad_glossary_cache_is_rebuilt(glossary_path, payload):
+    terms = load_business_terms(str(glossary_path))
+    cache_path = glossary_path.with_suffix('.cache.json')
+    
+    if payload == 'matching hash without data':
+        payload = json.dumps({'hash': json.loads(cache_path.read_text())['hash']})
+    cache_path.write_text(payload)
+    
+    assert load_business_terms(str(glossary_path)) == terms
+    assert json.loads(cache_path.read_text())['data'] == terms
+
+
+def test_fuzzy_candidates_keep_every_match(glossary_path):
+    mapper = TermMapper(str(glossary_path), CONFIG)
+    names = ['customer_emial', 'cust_id', 'customerid', 'email', 'customer_identifier', 'xyz']
+    
+    for threshold in (0.5, 0.7, 0.8, 0.95):
+        for name in names:
+            kept = set(mapper._fuzzy_candidates(name, threshold))
+            for idx, candidate in enumerate(mapper._match_names):
+                if SequenceMatcher(None, name, candidate, autojunk=False).ratio() >= threshold:
+                    assert idx in kept, (name, candidate, threshold)
+
+
+def test_column_mapping_keys_without_to_dict(monkeypatch):
+    mapping = make_mapping(match_type='exact', fuzzy_match_score=None, matched_term=None)
+    monkeypatch.setattr(ColumnMapping, 'to_dict', None)
+    
+    assert mapping['owner'] == 'CRM'
+    assert mapping['data_type'] == 'string'
+    assert len(mapping) == 12
+    assert 'matched_term' not in mapping
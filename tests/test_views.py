@@ -0,0 +1,91 @@
+"""Dashboard view frames built from the pipeline outputs."""
+
+import pandas as pd
+import pytest
+
+from dashboard.views import (
+    VIEW_FRAMES,
+    build_column_stats_frame,
+    build_dtype_frame,
+    build_glossary_frame,
+    build_null_frame,
+    build_schema_frame,
+    get_view_frame_path,
+    save_view_frames,
+)
+
+PROFILE = {
+    'basic_info': {'dtypes': {'id': 'int64', 'amount': 'float64', 'city': 'object', 'code': 'object'}},
+    'column_profiles': {
+        'id': {'data_type': 'int64', 'null_percentage': 0.0, 'unique_count': 4, 'unique_percentage': 100.0},
+        'amount': {'data_type': 'float64', 'null_count': 1, 'null_percentage': 25.0,
+                   'unique_count': 3, 'unique_percentage': 75.0},
+        'city': {'data_type': 'object', 'null_count': 2, 'null_percentage': 50.0,
+                 'unique_count': 1, 'unique_percentage': 25.0},
+    },
+}
+
+DICTIONARY = {
+    'columns': [
+        {'technical_name': 'id', 'business_name': 'Identifier', 'description': 'Row id',
+         'owner': 'Ops', 'is_pii': False},
+        {'technical_name': 'email', 'business_name': 'Email'},
+    ],
+}
+
+METADATA = {
+    'schema': [
+        {'column_name': 'id', 'data_type': 'int64', 'sql_type': 'SMALLINT',
+         'nullable': False, 'is_unique': True, 'position': 1},
+        {'column_name': 'city', 'data_type': 'object', 'sql_type': 'VARCHAR(5)',
+         'nullable': True, 'is_unique': False, 'position': 2},
+    ],
+}
+
+
+def test_dtype_frame():
+    frame = build_dtype_frame(PROFILE)
+    assert dict(zip(frame['Data Type'], frame['Count'])) == {'object': 2, 'int64': 1, 'float64': 1}
+    assert frame['Count'].tolist() == [2, 1, 1]
+
+
+def test_column_stats_frame():
+    frame = build_column_stats_frame(PROFILE)
+    assert frame['Column'].tolist() == ['id', 'amount', 'city']
+    assert frame['Null %'].tolist() == ['0.0%', '25.0%', '50.0%']
+    assert frame['Unique'].tolist() == [4, 3, 1]
+
+
+def test_null_frame_lists_columns_with_nulls_most_first():
+    frame = build_null_frame(PROFILE)
+    assert frame['Column'].tolist() == ['city', 'amount']
+    assert frame['Null Count'].tolist() == [2, 1]
+
+
+def test_null_frame_without_nulls_is_empty():
+    assert build_null_frame({'column_profiles': {'id': {'null_percentage': 0.0}}}).empty
+
+
+def test_glossary_frame_defaults():
+    frame = build_glossary_frame(DICTIONARY)
+    assert frame['Definition'].tolist() == ['Row id', 'N/A']
+    assert frame['Owner'].tolist() == ['Ops', 'Unassigned']
+    assert frame['PII'].tolist() == ['', '']
+
+
+def test_schema_frame():
+    frame = build_schema_frame(METADATA)
+    assert frame['Nullable'].tolist() == ['✗', '✓']
+    assert frame['Unique'].tolist() == ['✓', '✗']
+    assert frame['Position'].tolist() == [1, 2]
+
+
+def test_save_view_frames(tmp_path):
+    pytest.importorskip('pyarrow')
+    outputs = {'profile': PROFILE, 'dictionary': DICTIONARY, 'metadata': METADATA}
+    
+    save_view_frames('sales', outputs, tmp_path)
+    
+    for view_name, (builder, source) in VIEW_FRAMES.items():
+        saved = pd.read_parquet(get_view_frame_path(tmp_path, 'sales', view_name))
+        pd.testing.assert_frame_equal(saved, builder(outputs[source]).reset_index(drop=True))